@@ -1,7 +1,13 @@
-from utilities.logging_util import logger
+# Controllers are imported on first use, so that importing one of them does
+# not load the others
+
+
+def __getattr__(name):
+    if name == "VocabularyController":
+        from .vocabulary_controller import VocabularyController
+
+        return VocabularyController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logger.info("controller module initalized.")
-# Import controllers
-from .vocabulary_controller import VocabularyController
 
 # Future controllers can be added here
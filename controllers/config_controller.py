@@ -11,6 +11,33 @@ class ConfigController:
     def get_total_questions(self) -> int:
         return self.config.get("total_questions")
 
+    def get_vocabulary_storage(self) -> str:
+        return self.config.get("vocabulary_storage")
+
+    def get_vocabulary_ingest_workers(self) -> int:
+        return self.config.get("vocabulary_ingest_workers")
+
+    def get_distractor_mode(self) -> str:
+        return self.config.get("distractor_mode")
+
+    def get_storage_backend(self) -> str:
+        return self.config.get("storage_backend")
+
+    def get_user_data_format(self) -> str:
+        return self.config.get("user_data_format")
+
+    def get_write_latency(self) -> float:
+        return self.config.get("write_latency")
+
+    def get_log_async(self) -> bool:
+        return self.config.get("log_async")
+
+    def get_log_format(self) -> str:
+        return self.config.get("log_format")
+
+    def get_log_debug_sample(self) -> int:
+        return self.config.get("log_debug_sample")
+
     def get_complete_config(self) -> dict:
         return self.config.get_all()
 
@@ -1,5 +1,4 @@
 # controllers/game_controller.py
-import random
 from colorama import Fore, Style
 
 from views.base_view import BaseView
@@ -8,6 +7,7 @@ from controllers.config_controller import ConfigController
 from controllers.player_controller import PlayerController
 from controllers.score_controller import ScoreController
 from models.language_model import LanguageModel
+from models.quiz_model import DistractorPool, QuizModel
 
 
 class GameController:
@@ -27,68 +27,6 @@ class GameController:
         self.vocab_controller = vocab_controller
         self.score_controller = score_controller
 
-    @staticmethod
-    def get_random_options(
-        correct_answer, correct_answer_id, vocabulary, word_type=None
-    ):
-        """
-        Get random options for multiple choice, with support for word type matching.
-
-        Args:
-            correct_answer: The correct translation
-            vocabulary: The complete vocabulary dictionary
-            word_type: The type of word to match (for level 3)
-        """
-        options = [correct_answer]
-        options_id = [correct_answer_id]
-        vocab_items = list(vocabulary.items())
-
-        if word_type:
-            # Filter vocabulary items to only include words of the same type
-            same_type_items = [
-                item
-                for item in vocab_items
-                if item[1]["word_type"] == word_type
-                and item[1]["translation"] != correct_answer
-            ]
-
-            # If we don't have enough words of the same type, fall back to random words
-            if len(same_type_items) < 3:
-                different_items = [
-                    item
-                    for item in vocab_items
-                    if item[1]["translation"] != correct_answer
-                ]
-                while len(options) < 4:
-                    random_item = random.choice(different_items)
-                    if random_item[1]["translation"] not in options:
-                        options.append(random_item[1]["translation"])
-                        options_id.append(random_item[0])
-            else:
-                # Add three random words of the same type
-                while len(options) < 4:
-                    random_item = random.choice(same_type_items)
-                    if random_item[1]["translation"] not in options:
-                        options.append(random_item[1]["translation"])
-                        options_id.append(random_item[0])
-        else:
-            # Original behavior for levels 1 and 2
-            different_items = [
-                item for item in vocab_items if item[1]["translation"] != correct_answer
-            ]
-            while len(options) < 4:
-                random_item = random.choice(different_items)
-                if random_item[1]["translation"] not in options:
-                    options.append(random_item[1]["translation"])
-                    options_id.append(random_item[0])
-
-        # Shuffle the options
-        combined = list(zip(options, options_id))
-        random.shuffle(combined)
-        options, options_id = zip(*combined)
-
-        return options, options_id
-
     def run(self):
         """Main game loop."""
         self.view.display_roman_intro()
@@ -106,6 +44,7 @@ class GameController:
                 level,
                 vocabulary,
                 total_questions=self.config_controller.get_total_questions(),
+                selection=self.vocab_controller.selection,
             )
             percentage = (score / total_questions) * 100
 
@@ -121,70 +60,92 @@ class GameController:
                 self.view.display_thanks_for_playing()
                 break
 
-    def play_quiz(self, level, vocabulary, total_questions=10):
-        """Refactored play_quiz logic inside GameController."""
+    def play_quiz(self, level, vocabulary, total_questions=10, selection=None):
+        """
+        Refactored play_quiz logic inside GameController.
+
+        Args:
+            level (int): Game level
+            vocabulary (Mapping): Loaded vocabulary
+            total_questions (int): Number of questions
+            selection (tuple): Files and range the vocabulary was loaded
+                from; the word sampler of the previous quiz is reused when
+                it is the same, rebuilt when None
+        """
         score = 0
         player_name = self.player_controller.get_current_player()
         self.view.display_welcome_message(player_name)
 
-        used_words = set()
-        available_words = set(vocabulary.keys())
-
-        for question_num in range(total_questions):
-            if not available_words:
-                available_words = set(vocabulary.keys())
-                used_words.clear()
+        if level == 5:
+            word_sampler = self.player_controller.review_scheduler(
+                vocabulary, selection
+            )
+        elif level == 4:
+            word_sampler = self.player_controller.weighted_sampler(
+                vocabulary, selection
+            )
+        else:
+            word_sampler = self.player_controller.unplayed_tracker(
+                vocabulary, selection
+            )
 
-            if level == 4:
-                word_id = self.player_controller.weighted_choice(list(available_words))
-            else:
-                word_id = self.player_controller.unplayed_first_choice(
-                    list(available_words)
-                )
+        similarity = None
+        if (
+            level in [3, 4, 5]
+            and self.config_controller.get_distractor_mode() == "hard"
+        ):
+            similarity = self.vocab_controller.get_similarity_index()
+        pool = DistractorPool(vocabulary, similarity=similarity)
+
+        # Answers change the mastery the sampler refills with, so the quiz is
+        # drawn one round at a time: a round never repeats a word, and the
+        # next one is only drawn once the answers of this one are recorded.
+        question_num = 0
+        while question_num < total_questions:
+            quiz = QuizModel.generate_quiz(
+                level,
+                vocabulary,
+                min(total_questions - question_num, len(vocabulary)),
+                pool=pool,
+                word_sampler=word_sampler,
+            )
 
-            available_words.remove(word_id)
-            used_words.add(word_id)
-            word_data = vocabulary[word_id]
+            for question in quiz.questions:
+                word_id = question.word_id
+                word_data = vocabulary[word_id]
 
-            if level in [3, 4]:
-                options, options_id = self.get_random_options(
-                    word_data["translation"],
-                    word_id,
-                    vocabulary,
-                    word_data.get("word_type"),
-                )
-            else:
-                options, options_id = self.get_random_options(
-                    word_data["translation"], word_id, vocabulary
-                )
+                self.view.display_question_header(question_num + 1, total_questions)
+                self.view.display_latin_word(word_data)
 
-            self.view.display_question_header(question_num + 1, total_questions)
-            self.view.display_latin_word(word_data)
+                if level in [0, 1]:
+                    self.view.display_hint(word_data.hint)
 
-            if level in [0, 1]:
-                self.view.display_hint(word_data["hint"])
+                self.view.display_options(
+                    question.options, question.options_id if level == 0 else None
+                )
 
-            self.view.display_options(options, options_id if level == 0 else None)
+                answer = self.view.ask_for_answer(len(question.options))
 
-            answer = self.view.ask_for_answer()
+                if level in [2, 3, 4, 5]:
+                    self.view.display_hint(word_data.hint)
 
-            if level in [2, 3, 4]:
-                self.view.display_hint(word_data["hint"])
+                is_correct = answer == question.answer
+                if is_correct:
+                    score += 1
 
-            is_correct = options[answer - 1] == word_data["translation"]
-            if is_correct:
-                score += 1
+                self.view.display_feedback(
+                    is_correct,
+                    word_data.translation,
+                    word_data.hint,
+                    score,
+                    question_num,
+                )
 
-            self.view.display_feedback(
-                is_correct,
-                word_data["translation"],
-                word_data["hint"],
-                score,
-                question_num,
-            )
+                self.player_controller.update_mastery_data(word_id, is_correct)
+                question_num += 1
 
-            self.player_controller.update_mastery_data(word_id, is_correct)
-            self.player_controller.save_mastery_data()
+        # Answers were journaled one by one, fold them into the mastery file
+        self.player_controller.save_mastery_data()
 
         # Final feedback
         self.view.display_final_score(score, total_questions, player_name)
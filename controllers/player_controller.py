@@ -1,7 +1,10 @@
 from models.player_model import PlayerModel
 from models.mastery_model import MasteryModel
+from models.mastery_table import MasteryTable, word_weight
 from views.cli_view import BaseView
 from models.language_model import LanguageModel
+from models.review_scheduler import ReviewScheduler
+from models.word_sampler import UnplayedTracker
 from models.score_model import ScoreModel
 
 
@@ -29,6 +32,8 @@ class PlayerController:
         self._lang = lang_manager
         self.current_player = None
         self.mastery_data = None
+        self._sampler = None
+        self._sampler_key = None  # (builder, selection, size) of the sampler
 
     def select_player(self) -> str:
         """
@@ -57,8 +62,8 @@ class PlayerController:
             if choice <= len(players):
                 selected_player = self.player_model.select_player(choice)
                 self._view.display_message(
-                    self._lang.get("player_management.selected_player").format(
-                        player=selected_player
+                    self._lang.format(
+                        "player_management.selected_player", player=selected_player
                     )
                 )
                 self.current_player = selected_player
@@ -76,8 +81,9 @@ class PlayerController:
 
                 if self.current_player is not None:
                     self._view.display_message(
-                        self._lang.get("player_management.player_added").format(
-                            player=self.current_player
+                        self._lang.format(
+                            "player_management.player_added",
+                            player=self.current_player,
                         )
                     )
 
@@ -95,24 +101,26 @@ class PlayerController:
         """
         return self.current_player if hasattr(self, "current_player") else None
 
-    def load_mastery_data(self) -> dict:
+    def load_mastery_data(self) -> MasteryTable:
         """
         Load mastery data for the current player.
 
         Returns:
-            Mastery data dictionary
+            Mastery data table
         """
         if self.current_player is None:
             raise ValueError("No player selected. Please select a player first.")
 
         self.mastery_data = self._mastery_model.load_mastery_data(self.current_player)
+        self._sampler = None
+        self._sampler_key = None
 
-    def get_mastery_data(self) -> dict:
+    def get_mastery_data(self) -> MasteryTable:
         """
         Get the mastery data for the current player.
 
         Returns:
-            dict: Mastery data for the current player.
+            MasteryTable: Mastery data for the current player.
         """
         if self.current_player is None:
             raise ValueError("No player selected. Please select a player first.")
@@ -127,10 +135,25 @@ class PlayerController:
         if self.mastery_data is None:
             self.load_mastery_data()
 
-        word_id = str(word_id)
-        self.mastery_data[word_id]["total_attempts"] += 1
-        if is_correct:
-            self.mastery_data[word_id]["correct_attempts"] += 1
+        self.mastery_data.record(word_id, is_correct)
+
+        if self._sampler is None or word_id not in self._sampler:
+            pass
+        elif isinstance(self._sampler, ReviewScheduler):
+            self._sampler.review(
+                word_id, self.mastery_data.schedule(word_id), is_correct
+            )
+        elif isinstance(self._sampler, UnplayedTracker):
+            self._sampler.mark_played(word_id)
+        else:
+            self._sampler.set_weight(
+                word_id, word_weight(*self.mastery_data.attempts(word_id))
+            )
+
+        # Only the answer is written now, save_mastery_data rewrites the file
+        self._mastery_model.record_answer(
+            self.current_player, self.mastery_data, word_id, is_correct
+        )
 
     def save_mastery_data(self):
         """
@@ -138,7 +161,7 @@ class PlayerController:
 
         Args:
             user_name (str): Name of the user.
-            mastery_data (dict): Mastery data to save.
+            mastery_data (MasteryTable): Mastery data to save.
         """
         if self.current_player is None:
             raise ValueError("No player selected. Please select a player first.")
@@ -148,43 +171,92 @@ class PlayerController:
 
         self._mastery_model.save_mastery_data(self.current_player, self.mastery_data)
         self._view.display_message(
-            self._lang.get("player_management.mastery_data_saved").format(
-                user=self.current_player
+            self._lang.format(
+                "player_management.mastery_data_saved", user=self.current_player
             )
         )
 
-    def unplayed_first_choice(self, available_words):
+    def _sampler_for(self, build, vocabulary, selection):
         """
-        Select the first unplayed word from the available words.
+        Sampler of the last quiz, restored, when it was built the same way
+        for the same vocabulary selection; a new one from build otherwise.
+
+        Reusing it keeps the updates made by update_mastery_data instead of
+        paying for a rebuild over the whole vocabulary before each quiz.
 
         Args:
-            available_words (list): List of available words.
-            mastery_data (dict): Mastery data for the current player.
+            build (callable): MasteryModel method building the sampler
+            vocabulary (Mapping): Loaded vocabulary.
+            selection (tuple): Files and range the vocabulary was loaded
+                from, None to always build a new sampler
 
         Returns:
-            str: The first unplayed word ID.
+            The sampler, with no word drawn
         """
 
         if self.mastery_data is None:
             self.load_mastery_data()
 
-        return self._mastery_model.unplayed_first_choice(
-            available_words, self.mastery_data
+        key = (build, selection, len(vocabulary))
+        if selection is not None and key == self._sampler_key:
+            self._sampler.restore()
+        else:
+            self._sampler = build(vocabulary, self.mastery_data)
+            self._sampler_key = key
+        return self._sampler
+
+    def weighted_sampler(self, vocabulary, selection=None):
+        """
+        Get the mastery weighted sampler used to draw the words of a quiz.
+
+        The sampler is kept up to date by update_mastery_data, and reused by
+        the next quizzes of the player on the same selection.
+
+        Args:
+            vocabulary (Mapping): Loaded vocabulary.
+            selection (tuple): Files and range it was loaded from
+
+        Returns:
+            WeightedSampler: Sampler over the word IDs of the vocabulary.
+        """
+        return self._sampler_for(
+            self._mastery_model.weighted_sampler, vocabulary, selection
         )
 
-    def weighted_choice(self, available_words):
+    def unplayed_tracker(self, vocabulary, selection=None):
         """
-        Select a word ID based on mastery data with weighting.
+        Get the tracker drawing unplayed words first for a quiz.
+
+        Answers recorded by update_mastery_data mark the words as played, and
+        the tracker is reused by the next quizzes of the player on the same
+        selection.
 
         Args:
-            available_words (set): Set of available word IDs.
-            mastery_data (dict): User performance data.
+            vocabulary (Mapping): Loaded vocabulary.
+            selection (tuple): Files and range it was loaded from
 
         Returns:
-            str: Selected word ID.
+            UnplayedTracker: Tracker over the word IDs of the vocabulary.
         """
+        return self._sampler_for(
+            self._mastery_model.unplayed_tracker, vocabulary, selection
+        )
 
-        if self.mastery_data is None:
-            self.load_mastery_data()
+    def review_scheduler(self, vocabulary, selection=None):
+        """
+        Get the spaced repetition scheduler drawing the words of a quiz.
 
-        return self._mastery_model.weighted_choice(available_words, self.mastery_data)
+        Answers recorded by update_mastery_data reschedule the words, and the
+        scheduler is reused by the next quizzes of the player on the same
+        selection.
+
+        Args:
+            vocabulary (Mapping): Loaded vocabulary.
+            selection (tuple): Files and range it was loaded from
+
+        Returns:
+            ReviewScheduler: Scheduler over the word IDs of the vocabulary.
+        """
+        return self._sampler_for(
+            self._mastery_model.review_scheduler, vocabulary, selection
+        )
@@ -10,9 +10,11 @@ class ScoreController:
         self.view = view
 
     def show_player_statistics(self, player_name):
-        player_data, levels = self.score_model.get_display_data(player_name)
+        player_data, levels, vocabularies = self.score_model.get_display_data(
+            player_name
+        )
 
-        self.view.display_player_stats(player_name, player_data, levels)
+        self.view.display_player_stats(player_name, player_data, levels, vocabularies)
 
     def update_player_score(
         self, player_name, vocab_files, level, new_score, period=None
@@ -29,3 +31,5 @@ class ScoreController:
         self.score_model.update_score(
             player_name, vocab_files, level, new_score, period=period
         )
+        # The quiz is over: its answers and score are on disk from here on
+        self.score_model.flush()
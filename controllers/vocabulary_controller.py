@@ -1,4 +1,3 @@
-import os
 import logging
 
 
@@ -7,10 +6,11 @@ class VocabularyController:
         self.vocabulary_model = vocabulary_model
         self.view = view
         self.lang_manager = lang_manager
+        # (files, custom range) of the last loaded vocabulary
+        self.selection = None
 
     def load_vocabulary(self):
-        directory = self.vocabulary_model.directory
-        files = [f for f in os.listdir(directory) if f.endswith(".txt")]
+        files = self.vocabulary_model.files
 
         if not files:
             logging.error(self.lang_manager.get("vocabulary_management.no_files_found"))
@@ -29,14 +29,21 @@ class VocabularyController:
 
             if 0 < choice <= len(files):
                 filenames = [files[choice - 1]]
+                self.selection = (tuple(filenames), None)
                 return self.vocabulary_model.load(filenames), filenames
             elif choice == 0:
+                self.selection = (tuple(files), None)
                 return self.vocabulary_model.load(files), files
             elif choice == -1:
                 custom_range = self.view.get_custom_range(min_id, max_id)
                 if custom_range:
-                    self.vocabulary_model.load(files, custom_range), files
+                    self.selection = (tuple(files), tuple(custom_range))
+                    return self.vocabulary_model.load(files, custom_range), files
             else:
                 message = self.lang_manager.get("vocabulary_management.invalid_choice")
                 logging.warning(message)
                 self.view.cli_view_warning(message)
+
+    def get_similarity_index(self):
+        """Return the spelling similarity index of the whole corpus."""
+        return self.vocabulary_model.similarity_index
@@ -1,9 +1,14 @@
-from utilities.logging_util import logger
+# Models are imported on first use, so that importing one of them does not
+# load the others
 
-logger.info("Models module initialized.")
 
-# Import models
-from .vocabulary_model import VocabularyModel
+def __getattr__(name):
+    if name == "VocabularyModel":
+        from .vocabulary_model import VocabularyModel
+
+        return VocabularyModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # from .mastery import Mastery
 # from .score import Score
@@ -0,0 +1,312 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import ItemsView, Mapping, ValuesView
+from pathlib import Path
+
+from models.vocab_entry import VocabEntry
+
+STORE_FILE = Path("./user_data/cache/vocabulary.col")
+
+MAGIC = b"QYZCOL01"
+FIELDS = VocabEntry._fields
+
+# Magic followed by the length of the JSON header
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _pad(length: int) -> int:
+    """Number of bytes needed to align length on 8 bytes."""
+    return -length % 8
+
+
+class ColumnarVocabularyStore:
+    """
+    Read-only columnar vocabulary file, memory-mapped on open.
+
+    Layout, after a small JSON header describing the source files:
+
+    - ids: sorted int64 word IDs, one per row
+    - members: uint32 row indices of each source file, file after file
+    - offsets: uint64 offsets into the blob, (rows + 1) per field
+    - blob: every string of every field, UTF-8 encoded, field after field
+
+    Strings are only decoded when an entry is accessed, so opening the store
+    costs the same whatever the size of the corpus.
+    """
+
+    def __init__(self, path: Path = STORE_FILE):
+        """
+        Open and map an existing store.
+
+        Args:
+            path (Path): Location of the columnar file
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_length = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a columnar vocabulary file.")
+
+        start = _PREFIX.size
+        self.header = json.loads(self._mmap[start : start + header_length])
+        self.count = self.header["count"]
+        self.files = self.header["files"]
+
+        data_start = start + header_length + _pad(start + header_length)
+        buffer = memoryview(self._mmap)
+        sections = {}
+        for name, (offset, length) in self.header["sections"].items():
+            sections[name] = buffer[data_start + offset : data_start + offset + length]
+
+        self.ids = sections["ids"].cast("q")
+        self.members = sections["members"].cast("I")
+        self.offsets = sections["offsets"].cast("Q")
+        self._blob_start = data_start + self.header["sections"]["blob"][0]
+
+    @classmethod
+    def build(cls, catalog, path: Path = STORE_FILE):
+        """
+        Write a columnar store holding every entry of a vocabulary catalog.
+
+        Args:
+            catalog (VocabularyCatalog): Source of the entries
+            path (Path): Location of the columnar file
+
+        Returns:
+            ColumnarVocabularyStore: The newly written store, opened
+        """
+        path = Path(path)
+        vocabulary = catalog.load(catalog.files)
+        ids = array("q", vocabulary)
+        row_of = {word_id: row for row, word_id in enumerate(ids)}
+
+        members = array("I")
+        files = {}
+        for filename in catalog.files:
+            stat = (catalog.directory / filename).stat()
+            rows = sorted(row_of[word_id] for word_id in catalog.words(filename))
+            try:
+                min_id, max_id = catalog.id_range([filename])
+            except ValueError:
+                min_id, max_id = None, None
+            files[filename] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "min_id": min_id,
+                "max_id": max_id,
+                "members": [len(members), len(rows)],
+            }
+            members.extend(rows)
+
+        blob = bytearray()
+        offsets = array("Q")
+        for field in FIELDS:
+            for word_data in vocabulary.values():
+                offsets.append(len(blob))
+                blob += getattr(word_data, field).encode("utf-8")
+            offsets.append(len(blob))
+
+        sections = {}
+        payload = bytearray()
+        for name, data in (
+            ("ids", ids.tobytes()),
+            ("members", members.tobytes()),
+            ("offsets", offsets.tobytes()),
+            ("blob", bytes(blob)),
+        ):
+            sections[name] = [len(payload), len(data)]
+            payload += data + b"\0" * _pad(len(data))
+
+        header = json.dumps(
+            {"count": len(ids), "files": files, "sections": sections}
+        ).encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as file:
+            file.write(_PREFIX.pack(MAGIC, len(header)))
+            file.write(header)
+            file.write(b"\0" * _pad(_PREFIX.size + len(header)))
+            file.write(payload)
+        os.replace(tmp_path, path)
+
+        return cls(path)
+
+    @classmethod
+    def open_for(cls, catalog, path: Path = STORE_FILE):
+        """
+        Open the store matching a catalog, rebuilding it when it is stale.
+
+        The store is considered current when it was built from exactly the
+        files of the catalog, with unchanged size and mtime.
+
+        Args:
+            catalog (VocabularyCatalog): Catalog the store must reflect
+            path (Path): Location of the columnar file
+
+        Returns:
+            ColumnarVocabularyStore: An opened, up-to-date store
+        """
+        path = Path(path)
+        if path.exists():
+            try:
+                store = cls(path)
+            except (OSError, ValueError):
+                store = None
+            if store is not None:
+                if store.is_current(catalog):
+                    return store
+                store.close()
+
+        return cls.build(catalog, path)
+
+    def is_current(self, catalog) -> bool:
+        """Check whether the store still reflects the files of a catalog."""
+        if sorted(self.files) != sorted(catalog.files):
+            return False
+        for filename, info in self.files.items():
+            try:
+                stat = (catalog.directory / filename).stat()
+            except OSError:
+                return False
+            if (stat.st_size, stat.st_mtime_ns) != (info["size"], info["mtime_ns"]):
+                return False
+        return True
+
+    def close(self) -> None:
+        """Release the mapping and the underlying file."""
+        for name in ("ids", "members", "offsets"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        if getattr(self, "_mmap", None) is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Still referenced by a live view
+        self._file.close()
+
+    def entry(self, row: int) -> VocabEntry:
+        """Decode the entry stored at a row."""
+        stride = self.count + 1
+        fields = []
+        for index in range(len(FIELDS)):
+            base = index * stride + row
+            start = self._blob_start + self.offsets[base]
+            end = self._blob_start + self.offsets[base + 1]
+            fields.append(self._mmap[start:end].decode("utf-8"))
+        fields[-1] = sys.intern(fields[-1])
+        return VocabEntry(*fields)
+
+    def id_range(self, filenames):
+        """Determine the min and max word IDs across the given files."""
+        ranges = [
+            (self.files[name]["min_id"], self.files[name]["max_id"])
+            for name in filenames
+            if self.files[name]["min_id"] is not None
+        ]
+        if not ranges:
+            raise ValueError("No valid word IDs found in the provided files.")
+
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+    def view(self, filenames=None, custom_range=None):
+        """
+        Return a lazy mapping over the entries of some files.
+
+        Args:
+            filenames (list): Files to include, all files when None
+            custom_range (tuple): Optional inclusive (start, end) ID range
+
+        Returns:
+            ColumnarVocabulary: Mapping of word ID to entry, sorted by ID
+        """
+        if filenames is None or set(filenames) >= set(self.files):
+            rows = range(self.count)
+        else:
+            selected = set()
+            for filename in filenames:
+                start, count = self.files[filename]["members"]
+                selected.update(self.members[start : start + count])
+            rows = sorted(selected)
+
+        if custom_range:
+            first, last = custom_range
+            low = bisect_left(rows, bisect_left(self.ids, first))
+            high = bisect_left(rows, bisect_right(self.ids, last))
+            rows = rows[low:high]
+
+        return ColumnarVocabulary(self, rows)
+
+
+class ColumnarVocabulary(Mapping):
+    """
+    Mapping of word ID to entry backed by a ColumnarVocabularyStore.
+
+    Holds only the sorted row numbers it covers; entries are decoded from the
+    mapped file on access.
+    """
+
+    def __init__(self, store: ColumnarVocabularyStore, rows):
+        self._store = store
+        self._rows = rows
+
+    def _row(self, word_id):
+        if not isinstance(word_id, int):
+            raise KeyError(word_id)
+        row = bisect_left(self._store.ids, word_id)
+        if row == self._store.count or self._store.ids[row] != word_id:
+            raise KeyError(word_id)
+        position = bisect_left(self._rows, row)
+        if position == len(self._rows) or self._rows[position] != row:
+            raise KeyError(word_id)
+        return row
+
+    def __getitem__(self, word_id):
+        return self._store.entry(self._row(word_id))
+
+    def __contains__(self, word_id):
+        try:
+            self._row(word_id)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        ids = self._store.ids
+        return (ids[row] for row in self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def items(self):
+        return _ColumnarItemsView(self)
+
+    def values(self):
+        return _ColumnarValuesView(self)
+
+
+class _ColumnarItemsView(ItemsView):
+    """Items view decoding rows in order, without any ID lookup."""
+
+    def __iter__(self):
+        store = self._mapping._store
+        for row in self._mapping._rows:
+            yield store.ids[row], store.entry(row)
+
+
+class _ColumnarValuesView(ValuesView):
+    """Values view decoding rows in order, without any ID lookup."""
+
+    def __iter__(self):
+        store = self._mapping._store
+        for row in self._mapping._rows:
+            yield store.entry(row)
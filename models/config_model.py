@@ -1,37 +1,84 @@
+import json
 import os
 from pathlib import Path
-import yaml
 from typing import Any, Dict, Optional
 
+# Parsed configuration, reused while the YAML file is unchanged so that
+# starting the quiz does not need to import yaml. Stored as JSON, which
+# can not run code when read, next to the config directory.
+CACHE_FILE = Path(__file__).parent.parent / "user_data" / "cache" / "config.json"
+
 
 class ConfigModel:
     """Model for managing application configuration."""
 
-    def __init__(self, config_file: str = None):
+    def __init__(self, config_file: str = None, cache_file: Path = CACHE_FILE):
         """
         Initialize ConfigManager with a specific config file.
 
         Args:
             config_file (str): Name of the config file to load
+            cache_file (Path): Cache of the parsed config file
         """
         if config_file is None:
             config_file = "config.yaml"
 
         self._config_directory = Path(__file__).parent.parent / "config"
         self._config_file = self._config_directory / config_file
+        self._cache_file = Path(cache_file)
         self._config: Dict[str, Any] = {}
         self._load_config()
 
     def _load_config(self) -> None:
         """
-        Load configuration from YAML file.
+        Load configuration from YAML file, or from its cache when unchanged.
         Raises exception on loading errors for caller to handle.
         """
+        try:
+            stat = self._config_file.stat()
+        except FileNotFoundError as e:
+            raise RuntimeError(f"Config file error: {e}")
+        source = (str(self._config_file.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        cached = self._read_cache(source)
+        if cached is not None:
+            self._config = cached
+            return
+
+        import yaml
+
         try:
             with open(self._config_file, "r", encoding="utf-8") as file:
                 self._config = yaml.safe_load(file) or {}
         except (FileNotFoundError, yaml.YAMLError) as e:
             raise RuntimeError(f"Config file error: {e}")
+        self._write_cache(source)
+
+    def _read_cache(self, source) -> Optional[Dict[str, Any]]:
+        """Cached configuration, None when missing or made from another file."""
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as file:
+                cached = json.load(file)
+            cached_source, config = cached["source"], cached["config"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return config if cached_source == list(source) else None
+
+    def _write_cache(self, source) -> None:
+        try:
+            text = json.dumps({"source": source, "config": self._config})
+        except (TypeError, ValueError):
+            return
+        if json.loads(text)["config"] != self._config:
+            return  # not plain JSON data, it would be read back differently
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self._cache_file.with_suffix(".json.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.replace(tmp_file, self._cache_file)
+        except OSError:
+            pass  # the cache only saves time, the config was read anyway
 
     def get(self, key: str) -> Any:
         """
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """
+    Exclusive advisory lock shared by every process using the same file.
+
+    Used as a context manager around a read-merge-write of user data, so
+    quizzes running in several terminals against the same user_data never
+    overwrite each other's changes. The lock is released when the block
+    exits or when the process dies. It is not reentrant.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Lock file, created if missing and never removed
+        """
+        self.path = Path(path)
+        self._file = None
+
+    def __enter__(self):
+        file = open(self.path, "a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            else:
+                # Locks the first byte; LK_LOCK gives up after 10 seconds
+                file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except BaseException:
+            file.close()
+            raise
+        self._file = file
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        file, self._file = self._file, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            file.close()
@@ -0,0 +1,248 @@
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from models.file_lock import FileLock
+from models.mastery_journal import MasteryJournal
+from models.mastery_table import MasteryTable
+from models.score_history import GameRecord, ScoreHistory
+from models.serializers import read_file, write_file
+from models.storage import Storage
+
+USER_DATA_DIR = Path("./user_data")
+
+# The answer journal is folded into the snapshot once it grows beyond this size
+JOURNAL_LIMIT = 256 * 1024
+
+
+class JsonStorage(Storage):
+    """
+    Storage in JSON files under user_data.
+
+    Players have a single file. Every player has a mastery snapshot plus a
+    journal of the answers given since the snapshot, and a score shard in
+    the scores directory, so saving a player never rewrites the data of the
+    others. Scores of the former shared file are still read for players
+    without a shard. Game results are appended to a binary history.
+
+    Files are written in the configured user data format (see serializers)
+    and read whatever format they were written in.
+
+    Several quizzes may share the directory: every write takes a file lock,
+    reads what the other processes saved and merges into it. Answers are
+    journaled as counter increments and folded into the snapshot on disk,
+    scores are updated one game at a time, and players are only ever added.
+    """
+
+    def __init__(
+        self,
+        data_path: Path = USER_DATA_DIR,
+        players_file: str = "players.json",
+        scores_file: str = "player_scores.json",
+        journal_limit: int = JOURNAL_LIMIT,
+        data_format: str = "json",
+    ):
+        """
+        Args:
+            data_path (Path): Directory holding the files
+            players_file (str): Filename of the player list
+            scores_file (str): Filename of the former shared score file
+            journal_limit (int): Size in bytes beyond which the journal of a
+                player is folded into their snapshot
+            data_format (str): Format of the files written, see serializers
+        """
+        self.data_path = Path(data_path)
+        self.players_file = self.data_path / players_file
+        self.scores_file = self.data_path / scores_file
+        self.scores_dir = self.data_path / "scores"
+        self.locks_dir = self.data_path / "locks"
+        self.journal_limit = journal_limit
+        self.data_format = data_format
+        self.history = ScoreHistory(self.data_path / "history")
+        self._legacy_scores = None
+        # user name -> (stat of the snapshot, its generation)
+        self._generations = {}
+
+        # Ensure data directory exists
+        self.data_path.mkdir(parents=True, exist_ok=True)
+        self.locks_dir.mkdir(exist_ok=True)
+
+    def _lock(self, name) -> FileLock:
+        return FileLock(self.locks_dir / f"{name}.lock")
+
+    # Players
+
+    def load_players(self) -> Optional[List[str]]:
+        if not self.players_file.exists():
+            return None
+        return read_file(self.players_file)
+
+    def save_players(self, players: List[str]) -> None:
+        """Add the players to the saved list, keeping those added elsewhere."""
+        with self._lock("players"):
+            saved = self.load_players() or []
+            added = [name for name in players if name not in saved]
+            if added or not self.players_file.exists():
+                write_file(self.players_file, saved + added, self.data_format)
+
+    # Mastery
+
+    def _mastery_file(self, user_name) -> Path:
+        return self.data_path / f"{user_name}_vocabulary_mastery.json"
+
+    def _journal(self, user_name) -> MasteryJournal:
+        return MasteryJournal(
+            self.data_path / f"{user_name}_vocabulary_mastery.journal"
+        )
+
+    def _snapshot_generation(self, user_name) -> int:
+        """
+        Generation of the snapshot on disk, read again only when another
+        process has replaced the file. Called with the player lock held.
+        """
+        try:
+            stat = self._mastery_file(user_name).stat()
+        except FileNotFoundError:
+            return 0
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._generations.get(user_name)
+        if cached is None or cached[0] != key:
+            self._read_mastery(user_name)
+            cached = self._generations[user_name]
+        return cached[1]
+
+    def _read_mastery(self, user_name) -> MasteryTable:
+        """
+        Load the snapshot of a player and replay the answers journaled since.
+        Called with the player lock held.
+        """
+        mastery_file = self._mastery_file(user_name)
+
+        # Load existing mastery data if available
+        if os.path.exists(mastery_file):
+            stat = mastery_file.stat()
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            records = read_file(mastery_file)
+        else:
+            key, records = None, {}
+        generation = records.pop("_meta", {}).get("generation", 0)
+
+        mastery_data = MasteryTable.from_dict(records)
+
+        for entry in self._journal(user_name).replay(generation):
+            mastery_data.record(entry["id"], entry["ok"])
+            if "s" in entry:
+                mastery_data.schedules[entry["id"]] = entry["s"]
+        self._generations[user_name] = (key, generation)
+        return mastery_data
+
+    def load_mastery(self, user_name: str) -> MasteryTable:
+        with self._lock(f"mastery_{user_name}"):
+            return self._read_mastery(user_name)
+
+    def record_answer(
+        self, user_name: str, mastery_data: MasteryTable, word_id, is_correct: bool
+    ) -> None:
+        """
+        Journal an answer: only a single line is appended, the snapshot is
+        rewritten when the journal grows beyond journal_limit.
+        """
+        self.record_answers(user_name, mastery_data, [(word_id, is_correct)])
+
+    def record_answers(
+        self, user_name: str, mastery_data: MasteryTable, answers
+    ) -> None:
+        """Journal several answers with a single lock and write."""
+        entries = []
+        for word_id, is_correct in answers:
+            entry = {"id": word_id, "ok": int(is_correct)}
+            if word_id in mastery_data.schedules:
+                entry["s"] = mastery_data.schedules[word_id]
+            entries.append(entry)
+
+        with self._lock(f"mastery_{user_name}"):
+            journal = self._journal(user_name)
+            journal.extend(self._snapshot_generation(user_name), entries)
+            if journal.size > self.journal_limit:
+                self._compact(user_name)
+
+    def save_mastery(self, user_name: str, mastery_data: MasteryTable) -> None:
+        """
+        Fold the journal of a player into a new snapshot.
+
+        Every answer is already in the journal, from this quiz and from any
+        other one played meanwhile, so the snapshot is rebuilt from the disk
+        rather than from the mastery data in memory.
+        """
+        with self._lock(f"mastery_{user_name}"):
+            self._compact(user_name)
+
+    def _compact(self, user_name) -> None:
+        """
+        Write a new snapshot of a player and empty their journal. Called with
+        the player lock held.
+
+        The snapshot is written to a temporary file and moved into place
+        before the journal is removed, so a crash at any point leaves either
+        the old snapshot with its journal or the new one.
+        """
+        mastery_data = self._read_mastery(user_name)
+        generation = self._generations[user_name][1] + 1
+        data = {"_meta": {"generation": generation}, **mastery_data.to_dict()}
+        write_file(self._mastery_file(user_name), data, self.data_format, durable=True)
+
+        self._generations.pop(user_name)
+        self._journal(user_name).clear()
+
+    # Scores
+
+    def _score_shard(self, player_name) -> Path:
+        return self.scores_dir / f"{player_name}.json"
+
+    def _load_legacy_scores(self) -> dict:
+        """Scores of the shared file, read once and never written again."""
+        if self._legacy_scores is None:
+            if os.path.exists(self.scores_file):
+                self._legacy_scores = read_file(self.scores_file)
+            else:
+                self._legacy_scores = {}
+        return self._legacy_scores
+
+    def load_scores(self) -> dict:
+        scores = dict(self._load_legacy_scores())
+        for shard in sorted(self.scores_dir.glob("*.json")):
+            scores[shard.stem] = read_file(shard)
+        return scores
+
+    def load_player_scores(self, player_name: str) -> Optional[dict]:
+        shard = self._score_shard(player_name)
+        if shard.exists():
+            return read_file(shard)
+        return self._load_legacy_scores().get(player_name)
+
+    def save_player_scores(self, player_name: str, player_data: dict) -> None:
+        """Write the shard of the player atomically."""
+        with self._lock(f"scores_{player_name}"):
+            self._write_player_scores(player_name, player_data)
+
+    def _write_player_scores(self, player_name, player_data) -> None:
+        self.scores_dir.mkdir(exist_ok=True)
+        write_file(self._score_shard(player_name), player_data, self.data_format)
+
+    def update_player_scores(self, player_name: str, update) -> dict:
+        """Apply the update to the shard on disk, under the player lock."""
+        with self._lock(f"scores_{player_name}"):
+            player_data = update(self.load_player_scores(player_name))
+            self._write_player_scores(player_name, player_data)
+        return player_data
+
+    # Game history
+
+    def append_game(self, player_name: str, game: GameRecord) -> None:
+        self.history.append(player_name, game)
+
+    def load_games(self, player_name: str) -> List[GameRecord]:
+        return self.history.load(player_name)
+
+    def history_players(self) -> List[str]:
+        return self.history.players()
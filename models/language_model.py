@@ -1,22 +1,134 @@
 import json
+import os
 from pathlib import Path
 
 # Path to the default language file
 LANGUAGE_FILE = "french.json"
 
+# Compiled string tables, reused while the language files are unchanged.
+# Stored as JSON, which can not run code when read, next to the languages.
+CACHE_DIR = Path(__file__).parent.parent / "user_data" / "cache" / "language"
+
+# Bump whenever the layout of the compiled table changes
+CACHE_VERSION = 2
+
+
+def compile_strings(strings: dict) -> dict:
+    """
+    Flatten the sections of a language file into a single table.
+
+    Every string is stored under its "section.key" name, and under its bare
+    key for the first section defining it, so any lookup is one dict hit.
+
+    Args:
+        strings (dict): Sections of the language file
+
+    Returns:
+        dict: Key -> string
+    """
+    table = {}
+    for section, entries in strings.items():
+        if not isinstance(entries, dict):
+            continue
+        for key, value in entries.items():
+            table[f"{section}.{key}"] = value
+            table.setdefault(key, value)
+    return table
+
 
 class LanguageModel:
-    """Manages the loading and retrieval of language strings."""
+    """
+    Manages the loading and retrieval of language strings.
 
-    def __init__(self, language_file=LANGUAGE_FILE):
+    The language file is compiled into a flat table, cached on disk with
+    the translations and reused while neither file changes.
+    """
+
+    def __init__(self, language_file=LANGUAGE_FILE, cache_dir: Path = CACHE_DIR):
         self.language_directory = Path(__file__).parent.parent / "languages"
         self.language_file = self.language_directory / language_file
         self.language = language_file.strip(".json")
+        self.cache_file = Path(cache_dir) / f"{self.language}.json"
         self.strings = {}
-
-        self._load_language()
+        self.translations = {}
+        # Keys of the strings with replacement fields, the others need no
+        # formatting
+        self.templates = set()
+
+        sources = self._sources()
+        if not self._read_cache(sources):
+            self._load_language()
+            if self.language != "dutch":
+                self._load_translations()
+            self._compile()
+            if sources is not None:
+                self._write_cache(sources)
+
+    def _translation_file(self) -> Path:
+        return self.language_directory / (self.language + "-translations.txt")
+
+    def _sources(self):
+        """Path, size and mtime of the files the table is built from."""
+        paths = [self.language_file]
         if self.language != "dutch":
-            self._load_translations()
+            paths.append(self._translation_file())
+        try:
+            return tuple(
+                (str(path), stat.st_size, stat.st_mtime_ns)
+                for path, stat in ((path, path.stat()) for path in paths)
+            )
+        except OSError:
+            return None  # reported by the loaders
+
+    def _read_cache(self, sources) -> bool:
+        """Load the compiled table, when cached for the same files."""
+        if sources is None:
+            return False
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                cached = json.load(file)
+            if cached.get("version") != CACHE_VERSION or cached["sources"] != [
+                list(source) for source in sources
+            ]:
+                return False
+            strings = cached["strings"]
+            templates = set(cached["templates"])
+            # JSON object keys are strings, word IDs are ints
+            translations = {
+                int(word_id): text for word_id, text in cached["translations"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        self.strings = strings
+        self.templates = templates
+        self.translations = translations
+        return True
+
+    def _write_cache(self, sources) -> None:
+        cached = {
+            "version": CACHE_VERSION,
+            "sources": sources,
+            "strings": self.strings,
+            "templates": sorted(self.templates),
+            "translations": self.translations,
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".json.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as file:
+                json.dump(cached, file, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass  # the cache only saves time, the files were read anyway
+
+    def _compile(self):
+        """Flatten the loaded sections, see compile_strings."""
+        self.strings = compile_strings(self.strings)
+        self.templates = {
+            key
+            for key, value in self.strings.items()
+            if isinstance(value, str) and ("{" in value or "}" in value)
+        }
 
     def _load_language(self):
         """
@@ -38,10 +150,9 @@ class LanguageModel:
             RuntimeError: If translation file cannot be loaded
         """
         translations = {}
-        filepath = self.language_directory
         filename = self.language + "-translations.txt"
         try:
-            with open(filepath / filename, "r", encoding="utf-8") as file:
+            with open(self._translation_file(), "r", encoding="utf-8") as file:
                 for line in file:
                     parts = line.strip().split("|")
                     if len(parts) == 2:
@@ -59,23 +170,36 @@ class LanguageModel:
         Retrieve a language string by key, supporting nested keys.
 
         Args:
-            key (str): Key to retrieve, can be in 'section.subkey' format
+            key (str): Key to retrieve, can be in 'section.subkey' format;
+                a bare key is looked up in every section (For backward
+                compatibility purpose)
             default (str): Fallback value if key is not found
 
         Returns:
             str: Retrieved language string or default
         """
+        return self.strings.get(key, default)
 
-        if "." in key:
-            section, subkey = key.split(".", 1)
-            return self.strings.get(section, {}).get(subkey, default)
+    def format(self, key, default="", **values):
+        """
+        Retrieve a language string and fill in its replacement fields.
 
-        # Fallback search across all sections (For backward compatibility purpose)
-        for section in self.strings.values():
-            if isinstance(section, dict) and key in section:
-                return section[key]
+        Strings without any field are returned as they are.
 
-        return default
+        Args:
+            key (str): Key to retrieve, see get
+            default (str): Fallback template if key is not found
+            **values: Values of the replacement fields
+
+        Returns:
+            str: Formatted language string
+        """
+        template = self.strings.get(key)
+        if template is None:
+            return default.format(**values)
+        if key not in self.templates:
+            return template
+        return template.format(**values)
 
     def get_translation(self, word_id: int):
         """
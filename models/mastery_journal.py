@@ -0,0 +1,70 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+
+class MasteryJournal:
+    """
+    Append-only log of the answers given since the last mastery snapshot.
+
+    Each answer is one JSON line tagged with the generation of the snapshot
+    it applies to. Compacting writes a new snapshot with the next generation
+    before the journal is emptied, so lines left behind by a crash between
+    the two steps carry an older generation and are not replayed twice.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Location of the journal file
+        """
+        self.path = Path(path)
+
+    @property
+    def size(self) -> int:
+        """Size of the journal in bytes, 0 when it does not exist."""
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def append(self, generation: int, entry: dict) -> None:
+        """Append one answer to the journal."""
+        self.extend(generation, [entry])
+
+    def extend(self, generation: int, entries) -> None:
+        """Append answers to the journal in a single write."""
+        lines = "".join(
+            json.dumps({"g": generation, **entry}, separators=(",", ":")) + "\n"
+            for entry in entries
+        )
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+    def replay(self, generation: int):
+        """
+        Yield the answers recorded on top of the given snapshot generation.
+
+        A line cut short by a crash can only be the last one; it is skipped.
+        """
+        try:
+            file = open(self.path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Skipping truncated line in {self.path}")
+                    continue
+                if entry.pop("g", None) == generation:
+                    yield entry
+
+    def clear(self) -> None:
+        """Empty the journal once its answers are in a snapshot."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
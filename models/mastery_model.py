@@ -1,141 +1,93 @@
-import json
-import os
-import random
-from pathlib import Path
-
-import json
-import os
-from glob import glob
+from models.json_storage import JsonStorage
+from models.mastery_table import MasteryTable
+from models.review_scheduler import ReviewScheduler
+from models.storage import Storage
+from models.word_sampler import UnplayedTracker, WeightedSampler
 
 
 class MasteryModel:
-    def __init__(self):
+    def __init__(self, storage: Storage = None):
         self.user_name = None
-        self.vocab_dir = "vocabularies"
+        self.storage = storage or JsonStorage()
 
-    def load_mastery_data(self, user_name: str = None, vocab_dir: str = None):
+    def load_mastery_data(self, user_name: str = None):
         """
-        Load or initialize the mastery data for the given user, ensuring it includes
-        all words from the vocabulary files in the specified directory.
+        Load the mastery data for the given user.
+
+        Only the words the user has answered are stored; every other word
+        counts as unplayed. Loading never writes anything.
 
         Args:
             user_name (str): Name of the user.
-            vocab_dir (str): Path to the directory containing vocabulary files.
 
         Returns:
-            dict: Mastery data for all words in the vocabulary files.
+            MasteryTable: Mastery data of the user.
         """
         if user_name is None:
             raise ValueError("User name must be provided.")
-        if vocab_dir is None:
-            vocab_dir = self.vocab_dir
-
-        file_name = f"{user_name}_vocabulary_mastery.json"
-        mastery_file = Path("./user_data") / file_name
-
-        # Load existing mastery data if available
-        if os.path.exists(mastery_file):
-            with open(mastery_file, "r", encoding="utf-8") as file:
-                mastery_data = json.load(file)
-        else:
-            mastery_data = {}
-
-        # Load all vocabulary files
-        vocab_files = glob(os.path.join(vocab_dir, "*.txt"))
-        all_words = {}
-
-        for vocab_file in vocab_files:
-            with open(vocab_file, "r", encoding="utf-8") as file:
-                for line in file:
-                    if line.strip():
-                        parts = line.split("|")
-                        word_id = parts[0].strip()
-                        if word_id not in all_words:
-                            all_words[word_id] = {
-                                "correct_attempts": 0,
-                                "total_attempts": 0,
-                            }
-
-        # Merge new words into mastery data
-        for word_id, default_values in all_words.items():
-            if word_id not in mastery_data:
-                mastery_data[word_id] = default_values
-
-        # Sort mastery data by word_id
-        mastery_data = {k: mastery_data[k] for k in sorted(mastery_data, key=int)}
-
-        # Save the updated mastery file
-        with open(mastery_file, "w", encoding="utf-8") as file:
-            json.dump(mastery_data, file, indent=4)
+
+        mastery_data = self.storage.load_mastery(user_name)
 
         self.mastery_data = mastery_data
         return mastery_data
 
-    @staticmethod
-    def save_mastery_data(user_name, mastery_data):
-        """Save the mastery data for the given user."""
-        file_name = f"{user_name}_vocabulary_mastery.json"
-        mastery_file = Path("./user_data") / file_name
+    def record_answer(self, user_name, mastery_data: MasteryTable, word_id, is_correct):
+        """
+        Persist an answer already counted in the mastery data, without
+        rewriting the whole mastery data.
+
+        Args:
+            user_name (str): Name of the user.
+            mastery_data (MasteryTable): Mastery data holding the answer.
+            word_id (int): ID of the answered word.
+            is_correct (bool): Whether the answer was right.
+        """
+        self.storage.record_answer(user_name, mastery_data, word_id, is_correct)
 
-        with open(mastery_file, "w", encoding="utf-8") as file:
-            json.dump(mastery_data, file, indent=4)
+    def save_mastery_data(self, user_name, mastery_data: MasteryTable):
+        """Save the mastery data for the given user, with every recorded answer."""
+        self.storage.save_mastery(user_name, mastery_data)
 
     @staticmethod
-    def unplayed_first_choice(available_words, mastery_data):
+    def weighted_sampler(word_ids, mastery_data: MasteryTable) -> WeightedSampler:
         """
-        Select a word ID from the available words, prioritizing unplayed words first.
+        Build a sampler drawing word IDs with their mastery weights: higher
+        for unplayed words, lower for well-mastered ones.
 
         Args:
-            available_words (set): Set of available word IDs.
-            mastery_data (dict): User performance data.
+            word_ids (iterable): Word IDs to draw from.
+            mastery_data (MasteryTable): User performance data.
 
         Returns:
-            str: Selected word ID.
+            WeightedSampler: Sampler over the word IDs.
+        """
+        word_ids = list(word_ids)
+        return WeightedSampler(dict(zip(word_ids, mastery_data.weights(word_ids))))
+
+    @staticmethod
+    def unplayed_tracker(word_ids, mastery_data: MasteryTable) -> UnplayedTracker:
         """
-        # First, check for unplayed words
-        for word_id in available_words:
-            if (
-                mastery_data.get(str(word_id), {"total_attempts": 0})["total_attempts"]
-                == 0
-            ):
-                return word_id
+        Build a tracker drawing unplayed words first, in vocabulary order.
 
-        # If no unplayed words, return a random choice from available words
-        return random.choice(list(available_words))
+        Args:
+            word_ids (iterable): Word IDs to draw from, in vocabulary order.
+            mastery_data (MasteryTable): User performance data.
+
+        Returns:
+            UnplayedTracker: Tracker over the word IDs.
+        """
+        return UnplayedTracker(word_ids, mastery_data.is_unplayed)
 
     @staticmethod
-    def weighted_choice(available_words, mastery_data):
+    def review_scheduler(word_ids, mastery_data: MasteryTable) -> ReviewScheduler:
         """
-        Select a word ID based on mastery data with weighting:
-        - Higher weight for unplayed words.
-        - Medium weight for less mastered words.
-        - Lower weight for well-mastered words.
+        Build a scheduler drawing words by spaced repetition due date.
 
         Args:
-            available_words (set): Set of available word IDs.
-            mastery_data (dict): User performance data.
+            word_ids (iterable): Word IDs to draw from, in vocabulary order.
+            mastery_data (MasteryTable): User performance data.
 
         Returns:
-            str: Selected word ID.
+            ReviewScheduler: Scheduler over the word IDs.
         """
-        weights = []
-        for word_id in available_words:
-            data = mastery_data.get(
-                str(word_id), {"correct_attempts": 0, "total_attempts": 0}
-            )
-            total_attempts = data["total_attempts"]
-            correct_attempts = data["correct_attempts"]
-
-            if total_attempts == 0:
-                # Unplayed words get the highest weight
-                weight = 10
-            else:
-                # Weight inversely proportional to performance (1 - success rate)
-                success_rate = correct_attempts / total_attempts
-                weight = max(1, int((1 - success_rate) * 10))
-
-            weights.append(weight)
-
-        # Use the weights to make a random choice
-        word_ids = list(available_words)
-        return random.choices(word_ids, weights=weights, k=1)[0]
+        return ReviewScheduler(word_ids, mastery_data.schedules)
@@ -0,0 +1,152 @@
+from array import array
+from bisect import bisect_left
+
+# Counters stored in the arrays; any other field of a record in the mastery
+# file is spaced repetition state and goes to the schedules.
+COUNTER_FIELDS = ("correct_attempts", "total_attempts")
+
+
+def word_weight(correct: int, total: int) -> int:
+    """Selection weight of a word from its attempt counters, between 1 and 10."""
+    if total == 0:
+        # Unplayed words get the highest weight
+        return 10
+    # Weight inversely proportional to performance (1 - success rate)
+    return max(1, int((1 - correct / total) * 10))
+
+
+class MasteryTable:
+    """
+    Attempt counters of the words of a player, in parallel integer arrays.
+
+    Word IDs are kept sorted in an array and their position, found by
+    bisection, indexes two unsigned arrays holding the correct and total
+    attempts. That is about 24 bytes per word instead of a dict per word,
+    and success rates and weights are computed in a single pass over the
+    arrays. Spaced repetition state only exists for reviewed words and is
+    kept apart, in a sparse dict.
+
+    Words that are not tracked count as unplayed, so only the words a player
+    has answered need to be loaded and saved.
+    """
+
+    def __init__(self, word_ids=()):
+        """
+        Args:
+            word_ids (iterable): Word IDs to track
+        """
+        self.ids = array("q", sorted(set(word_ids)))
+        self.correct = array("L", bytes(len(self.ids) * array("L").itemsize))
+        self.total = array("L", self.correct)
+        self.schedules = {}  # word ID -> spaced repetition state
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, word_id):
+        return self.position(word_id) is not None
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def position(self, word_id):
+        """Index of a word in the arrays, None if it is not tracked."""
+        position = bisect_left(self.ids, word_id)
+        if position < len(self.ids) and self.ids[position] == word_id:
+            return position
+        return None
+
+    def add(self, word_id) -> int:
+        """Track a word with no attempt, if not tracked yet, and return its index."""
+        position = bisect_left(self.ids, word_id)
+        if position == len(self.ids) or self.ids[position] != word_id:
+            self.ids.insert(position, word_id)
+            self.correct.insert(position, 0)
+            self.total.insert(position, 0)
+        return position
+
+    def attempts(self, word_id):
+        """Return (correct attempts, total attempts) of a word."""
+        position = self.position(word_id)
+        if position is None:
+            return 0, 0
+        return self.correct[position], self.total[position]
+
+    def is_unplayed(self, word_id) -> bool:
+        position = self.position(word_id)
+        return position is None or self.total[position] == 0
+
+    def record(self, word_id, is_correct: bool) -> None:
+        """Count an answer to a word."""
+        position = self.add(word_id)
+        self.total[position] += 1
+        if is_correct:
+            self.correct[position] += 1
+
+    def schedule(self, word_id) -> dict:
+        """Spaced repetition state of a word, created empty when missing."""
+        return self.schedules.setdefault(word_id, {})
+
+    def success_rates(self) -> array:
+        """Success rate of every word, in index order (0 when unplayed)."""
+        return array(
+            "d",
+            (c / t if t else 0.0 for c, t in zip(self.correct, self.total)),
+        )
+
+    def weights(self, word_ids=None) -> list:
+        """
+        Selection weight of words: 10 when unplayed, otherwise inversely
+        proportional to the success rate, between 1 and 10.
+
+        Args:
+            word_ids (iterable): Words to weigh, every tracked word when None
+
+        Returns:
+            list: Weights in the order of word_ids (or of the table)
+        """
+        if word_ids is None:
+            counters = zip(self.correct, self.total)
+        else:
+            counters = map(self.attempts, word_ids)
+        return [word_weight(correct, total) for correct, total in counters]
+
+    @classmethod
+    def from_dict(cls, data: dict, word_ids=()):
+        """
+        Build a table from the content of a mastery file.
+
+        Args:
+            data (dict): Records keyed by string word ID
+            word_ids (iterable): Words to track even if missing from data
+
+        Returns:
+            MasteryTable: The table, ordered by word ID
+        """
+        table = cls([*map(int, data), *word_ids])
+
+        for key, record in data.items():
+            word_id = int(key)
+            position = table.position(word_id)
+            table.correct[position] = record.get("correct_attempts", 0)
+            table.total[position] = record.get("total_attempts", 0)
+            if len(record) > len(COUNTER_FIELDS):
+                table.schedules[word_id] = {
+                    k: v for k, v in record.items() if k not in COUNTER_FIELDS
+                }
+        return table
+
+    def to_dict(self) -> dict:
+        """
+        Records keyed by string word ID, the layout of the mastery file.
+
+        Unplayed words without spaced repetition state are left out.
+        """
+        data = {}
+        for word_id, correct, total in zip(self.ids, self.correct, self.total):
+            if total == 0 and word_id not in self.schedules:
+                continue
+            record = {"correct_attempts": correct, "total_attempts": total}
+            record.update(self.schedules.get(word_id, ()))
+            data[str(word_id)] = record
+        return data
@@ -1,57 +1,49 @@
-import json
-from pathlib import Path
 from typing import List, Optional
 
+from models.json_storage import JsonStorage
+from models.storage import Storage
+
 
 class PlayerModel:
     """Model for managing player data and interactions."""
 
-    def __init__(
-        self, data_path: Path = Path("./user_data"), filename: str = "players.json"
-    ):
+    def __init__(self, storage: Storage = None):
         """
         Initialize PlayerModel with data storage configuration.
 
         Args:
-            data_path (Path): Directory for storing player data
-            filename (str): Filename for player data storage
+            storage (Storage): Storage of the player data, JSON files by default
         """
-        self._data_path = data_path
-        self._file_path = data_path / filename
-
-        # Ensure data directory exists
-        self._data_path.mkdir(parents=True, exist_ok=True)
+        self._storage = storage or JsonStorage()
 
         # Load players on initialization
         self._players = self._load_players()
 
     def _load_players(self) -> List[str]:
         """
-        Load players from JSON file, create default if not exists.
+        Load players from storage, create default if not exists.
 
         Returns:
             List of player names
         """
-        if not self._file_path.exists():
-            # Create file with default player
+        players = self._storage.load_players()
+        if players is None:
+            # Create the list with default player
             return self._save_players(["Zélie"])
-
-        with open(self._file_path, "r", encoding="utf-8") as file:
-            return json.load(file)
+        return players
 
     def _save_players(self, players: List[str]) -> List[str]:
         """
-        Save players to JSON file.
+        Save players to storage.
 
         Args:
             players (List[str]): List of player names to save
 
         Returns:
-            The saved player list
+            The saved player list, with the players added by other sessions
         """
-        with open(self._file_path, "w", encoding="utf-8") as file:
-            json.dump(players, file, indent=4, ensure_ascii=False)
-        return players
+        self._storage.save_players(players)
+        return self._storage.load_players()
 
     def get_players(self) -> List[str]:
         """
@@ -77,8 +69,7 @@ class PlayerModel:
             return None
 
         if player_name not in self._players:
-            self._players.append(player_name)
-            self._save_players(self._players)
+            self._players = self._save_players(self._players + [player_name])
 
         return player_name
 
@@ -2,70 +2,267 @@
 # Denis Joassin 2024
 
 import random
+from typing import NamedTuple
+
+from models.similarity_index import SimilarityIndex
+from models.word_sampler import WeightedSampler
+
+
+class DistractorPool:
+    """
+    Pools of unique translations used to draw wrong options.
+
+    Built once per loaded vocabulary: one pool for the whole vocabulary and
+    one per word type. Each translation is kept once, with the ID of the
+    first word carrying it, so drawing distractors never needs to scan the
+    vocabulary.
+    """
+
+    def __init__(self, vocabulary, similarity: SimilarityIndex = None):
+        """
+        Args:
+            vocabulary (Mapping): Loaded vocabulary, word ID to VocabEntry
+            similarity (SimilarityIndex): When given, levels 3 to 5 draw
+                distractors among the words closest to the answer
+        """
+        self._vocabulary = vocabulary
+        self.similarity = similarity
+        # Each pool maps a translation to the ID of the first word carrying it
+        self._all = {}
+        self._by_type = {}
+        self.word_ids = []
+
+        for word_id, word_data in vocabulary.items():
+            self.word_ids.append(word_id)
+            self._all.setdefault(word_data.translation, word_id)
+            pool = self._by_type.setdefault(word_data.word_type, {})
+            pool.setdefault(word_data.translation, word_id)
+
+        self._all = self._freeze(self._all)
+        self._by_type = {
+            word_type: self._freeze(pool) for word_type, pool in self._by_type.items()
+        }
+
+    @staticmethod
+    def _freeze(pool):
+        """Turn a pool into (translations, IDs, translation set) for sampling."""
+        return list(pool), list(pool.values()), pool.keys()
+
+    @staticmethod
+    def _others(pool, exclude):
+        """Number of translations of a pool outside of an exclusion set."""
+        return len(pool[0]) - sum(translation in pool[2] for translation in exclude)
+
+    @staticmethod
+    def _draw(pool, exclude, count, rng):
+        translations, ids, _ = pool
+        # Translations are unique, so each excluded one can come up only once
+        size = len(translations)
+        indexes = rng.sample(range(size), min(size, count + len(exclude)))
+        picked = [i for i in indexes if translations[i] not in exclude][:count]
+        return [translations[i] for i in picked], [ids[i] for i in picked]
+
+    def _draw_similar(self, word_id, correct_answer, word_type, count, rng):
+        """Draw among the closest words of the same type, then fill in."""
+        seen = {correct_answer}
+        candidates = []
+        for other in self.similarity.similar(word_id):
+            word_data = self._vocabulary.get(other)
+            if word_data is None or word_data.word_type != word_type:
+                continue
+            if word_data.translation not in seen:
+                seen.add(word_data.translation)
+                candidates.append((word_data.translation, other))
+
+        # Keep a little variety among the best candidates
+        candidates = candidates[: count * 2]
+        picked = rng.sample(candidates, min(count, len(candidates)))
+        translations = [translation for translation, _ in picked]
+        ids = [other for _, other in picked]
+
+        if len(picked) < count:
+            # Fill in like the regular levels 3 to 5 would
+            exclude = {correct_answer, *translations}
+            missing = count - len(picked)
+            pool = self._by_type.get(word_type)
+            if not pool or self._others(pool, exclude) < missing:
+                pool = self._all
+            more, more_ids = self._draw(pool, exclude, missing, rng)
+            translations += more
+            ids += more_ids
+        return translations, ids
+
+    def sample(self, correct_answer, word_type=None, count=3, rng=random, word_id=None):
+        """
+        Draw distinct wrong translations.
+
+        When a word type is given and its pool holds enough other
+        translations, distractors are drawn from it, otherwise from the whole
+        vocabulary. If even the whole vocabulary has fewer than count other
+        translations, all of them are returned, so the call always ends.
+
+        With a similarity index, a word type and the ID of the answer, the
+        closest words of the same type are used first and the regular pools
+        only fill in what is missing.
+
+        Args:
+            correct_answer (str): Translation to exclude
+            word_type (str): Type of word to match (levels 3, 4 and 5)
+            count (int): Number of distractors wanted
+            rng (random.Random): Source of randomness
+            word_id (int): ID of the answer, needed for similar distractors
+
+        Returns:
+            tuple: (translations, word IDs) of the distractors
+        """
+        if word_type and self.similarity is not None and word_id is not None:
+            return self._draw_similar(word_id, correct_answer, word_type, count, rng)
+
+        if word_type:
+            pool = self._by_type.get(word_type)
+            if pool and self._others(pool, {correct_answer}) >= count:
+                return self._draw(pool, {correct_answer}, count, rng)
+
+        return self._draw(self._all, {correct_answer}, count, rng)
+
+
+class QuizQuestion(NamedTuple):
+    """A generated question: the word asked and its shuffled options."""
+
+    word_id: int
+    options: tuple
+    options_id: tuple
+    answer: int  # 1-based position of the correct option
+
+
+class Quiz(NamedTuple):
+    """A complete generated quiz, reproducible from its level and seed."""
+
+    level: int
+    seed: int
+    questions: tuple
+
+    def to_dict(self) -> dict:
+        """Plain representation, suitable for JSON."""
+        return {
+            "level": self.level,
+            "seed": self.seed,
+            "questions": [
+                [q.word_id, list(q.options), list(q.options_id), q.answer]
+                for q in self.questions
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Rebuild a quiz from the output of to_dict."""
+        return cls(
+            data["level"],
+            data["seed"],
+            tuple(
+                QuizQuestion(word_id, tuple(options), tuple(options_id), answer)
+                for word_id, options, options_id, answer in data["questions"]
+            ),
+        )
 
 
 class QuizModel:
     def __init__(self):
         pass
 
+    @staticmethod
+    def generate_quiz(
+        level,
+        vocabulary,
+        n=10,
+        seed=None,
+        pool: DistractorPool = None,
+        word_sampler: WeightedSampler = None,
+    ) -> Quiz:
+        """
+        Generate every question of a quiz in one pass.
+
+        Words are asked at most once until the whole vocabulary has been used.
+        Levels 3, 4 and 5 draw distractors of the same word type.
+
+        Args:
+            level (int): Game level
+            vocabulary (Mapping): Loaded vocabulary, word ID to VocabEntry
+            n (int): Number of questions
+            seed (int): Seed making the quiz reproducible, random when None
+            pool (DistractorPool): Pool of the vocabulary, built when None
+            word_sampler (WeightedSampler | UnplayedTracker | ReviewScheduler):
+                Draws the words (mastery based selection); words are drawn
+                uniformly at random when None
+
+        Returns:
+            Quiz: The generated quiz
+        """
+        if seed is None:
+            seed = random.randrange(2**32)
+        rng = random.Random(seed)
+        if pool is None:
+            pool = DistractorPool(vocabulary)
+        if not pool.word_ids:
+            raise ValueError("Cannot generate a quiz from an empty vocabulary.")
+
+        word_ids = []
+        if word_sampler is not None:
+            word_ids = [word_sampler.draw(rng) for _ in range(n)]
+        else:
+            # Draw whole rounds at once, a round never repeats a word
+            while len(word_ids) < n:
+                count = min(n - len(word_ids), len(pool.word_ids))
+                word_ids += rng.sample(pool.word_ids, count)
+
+        questions = []
+        for word_id in word_ids:
+            word_data = vocabulary[word_id]
+            options, options_id = QuizModel.get_random_options(
+                word_data.translation,
+                word_id,
+                vocabulary,
+                word_data.word_type if level in [3, 4, 5] else None,
+                pool=pool,
+                rng=rng,
+            )
+            answer = options_id.index(word_id) + 1
+            questions.append(QuizQuestion(word_id, options, options_id, answer))
+
+        return Quiz(level, seed, tuple(questions))
+
     @staticmethod
     def get_random_options(
-        correct_answer, correct_answer_id, vocabulary, word_type=None
+        correct_answer,
+        correct_answer_id,
+        vocabulary,
+        word_type=None,
+        pool: DistractorPool = None,
+        rng=random,
     ):
         """
         Get random options for multiple choice, with support for word type matching.
 
         Args:
             correct_answer: The correct translation
+            correct_answer_id: The word ID of the correct translation
             vocabulary: The complete vocabulary dictionary
             word_type: The type of word to match (for level 3)
+            pool: Distractor pool of the vocabulary, built on the fly when None
+            rng: Source of randomness
         """
-        options = [correct_answer]
-        options_id = [correct_answer_id]
-        vocab_items = list(vocabulary.items())
+        if pool is None:
+            pool = DistractorPool(vocabulary)
 
-        if word_type:
-            # Filter vocabulary items to only include words of the same type
-            same_type_items = [
-                item
-                for item in vocab_items
-                if item[1]["word_type"] == word_type
-                and item[1]["translation"] != correct_answer
-            ]
-
-            # If we don't have enough words of the same type, fall back to random words
-            if len(same_type_items) < 3:
-                different_items = [
-                    item
-                    for item in vocab_items
-                    if item[1]["translation"] != correct_answer
-                ]
-                while len(options) < 4:
-                    random_item = random.choice(different_items)
-                    if random_item[1]["translation"] not in options:
-                        options.append(random_item[1]["translation"])
-                        options_id.append(random_item[0])
-            else:
-                # Add three random words of the same type
-                while len(options) < 4:
-                    random_item = random.choice(same_type_items)
-                    if random_item[1]["translation"] not in options:
-                        options.append(random_item[1]["translation"])
-                        options_id.append(random_item[0])
-        else:
-            # Original behavior for levels 1 and 2
-            different_items = [
-                item for item in vocab_items if item[1]["translation"] != correct_answer
-            ]
-            while len(options) < 4:
-                random_item = random.choice(different_items)
-                if random_item[1]["translation"] not in options:
-                    options.append(random_item[1]["translation"])
-                    options_id.append(random_item[0])
+        distractors, distractors_id = pool.sample(
+            correct_answer, word_type, rng=rng, word_id=correct_answer_id
+        )
+        options = [correct_answer] + distractors
+        options_id = [correct_answer_id] + distractors_id
 
         # Shuffle the options
         combined = list(zip(options, options_id))
-        random.shuffle(combined)
+        rng.shuffle(combined)
         options, options_id = zip(*combined)
 
         return options, options_id
@@ -0,0 +1,141 @@
+import heapq
+import random
+import time
+
+DAY = 86400  # seconds
+
+# SM-2 parameters
+DEFAULT_EASE = 2.5
+MINIMUM_EASE = 1.3
+
+# Quality grades given to an answer (SM-2 scale from 0 to 5)
+CORRECT_QUALITY = 5
+WRONG_QUALITY = 2
+
+
+def sm2_review(record: dict, quality: int, now: float = None) -> dict:
+    """
+    Update the review schedule of a word after an answer (SM-2).
+
+    The schedule is saved in the mastery record of the word, next to its
+    attempt counters: "repetitions" (successful reviews in a row),
+    "interval" (days until the next review), "ease" and "due" (timestamp).
+
+    Args:
+        record (dict): Review state of the word, updated in place
+        quality (int): Grade of the answer, from 0 (blackout) to 5 (perfect)
+        now (float): Time of the answer, current time when None
+
+    Returns:
+        dict: The updated record
+    """
+    if now is None:
+        now = time.time()
+
+    repetitions = record.get("repetitions", 0)
+    interval = record.get("interval", 0)
+    ease = record.get("ease", DEFAULT_EASE)
+
+    if quality >= 3:
+        repetitions += 1
+        if repetitions == 1:
+            interval = 1
+        elif repetitions == 2:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+    else:
+        repetitions = 0
+        interval = 1
+
+    ease += 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+
+    record["repetitions"] = repetitions
+    record["interval"] = interval
+    record["ease"] = round(max(MINIMUM_EASE, ease), 2)
+    record["due"] = int(now + interval * DAY)
+    return record
+
+
+class ReviewScheduler:
+    """
+    Draws words by review due date, most overdue first.
+
+    Words are kept in a min-heap keyed by due timestamp, so drawing the next
+    word costs O(log N) whatever the size of the backlog. Words never
+    reviewed are due when the scheduler is built, after the overdue ones
+    and in vocabulary order. It follows the same draw()/restore() protocol
+    as WeightedSampler: drawn words leave the heap until restore, and are
+    pushed back with their new due date if they were reviewed meanwhile.
+    """
+
+    def __init__(self, word_ids, schedules: dict, now: float = None):
+        """
+        Args:
+            word_ids (iterable): Word IDs to draw from, in vocabulary order
+            schedules (dict): Review state of the reviewed words, by word ID
+            now (float): Due date of the words never reviewed, current time
+                when None
+        """
+        if now is None:
+            now = time.time()
+
+        self._schedules = schedules
+        self._order = {}
+        self._heap = []
+        self._drawn = []
+
+        for position, word_id in enumerate(word_ids):
+            self._order[word_id] = position
+            self._heap.append((self._due(word_id, now), position, word_id))
+        heapq.heapify(self._heap)
+        self._now = now
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, word_id):
+        return word_id in self._order
+
+    def _due(self, word_id, default):
+        return self._schedules.get(word_id, {}).get("due", default)
+
+    def draw(self, rng=random):
+        """
+        Draw the word due first and take it out of the heap until the next
+        restore.
+
+        Args:
+            rng (random.Random): Unused, the order only depends on due dates
+
+        Returns:
+            The drawn word ID
+        """
+        if not self._heap:
+            self.restore()
+            if not self._heap:
+                raise ValueError("Cannot draw from an empty scheduler.")
+
+        _, _, word_id = heapq.heappop(self._heap)
+        self._drawn.append(word_id)
+        return word_id
+
+    def review(self, word_id, record: dict, is_correct: bool, now: float = None):
+        """
+        Reschedule a word after an answer.
+
+        Args:
+            word_id: ID of the answered word
+            record (dict): Review state of the word, updated in place
+            is_correct (bool): Whether the answer was right
+            now (float): Time of the answer, current time when None
+        """
+        quality = CORRECT_QUALITY if is_correct else WRONG_QUALITY
+        sm2_review(record, quality, now)
+
+    def restore(self) -> None:
+        """Push every drawn word back with its current due date."""
+        for word_id in self._drawn:
+            entry = (self._due(word_id, self._now), self._order[word_id], word_id)
+            heapq.heappush(self._heap, entry)
+        self._drawn.clear()
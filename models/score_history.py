@@ -0,0 +1,160 @@
+import json
+import os
+import struct
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+
+from models.file_lock import FileLock
+
+# played_at (seconds), vocabulary index, level, score: 16 bytes per game
+RECORD = struct.Struct("<qHHf")
+
+
+class GameRecord(NamedTuple):
+    """Result of a single game."""
+
+    played_at: int  # Unix timestamp
+    vocab_id: str
+    level: int
+    score: float  # percentage, 0-100
+
+
+def ema_alpha(period: int) -> float:
+    """Smoothing factor of an EMA over a period (0.25 for 7 games)."""
+    return 2 / (period + 1)
+
+
+def smooth_history(games, period: int, smoother: str = "ema") -> dict:
+    """
+    Recompute the smoothed score of every vocabulary and level from history.
+
+    All series are smoothed in a single pass over the games, which must be
+    in the order they were played.
+
+    Args:
+        games (iterable): GameRecord of a player, oldest first
+        period (int): Smoothing period, in games
+        smoother (str): "ema" (exponential) or "sma" (mean of the last
+            period games)
+
+    Returns:
+        dict: (vocab_id, level as str) -> {"ema": score, "games_played": n}
+    """
+    if smoother not in ("ema", "sma"):
+        raise ValueError(f"Unknown smoother '{smoother}'.")
+
+    alpha = ema_alpha(period)
+    smoothed = {}
+    windows = {}
+    for game in games:
+        key = (game.vocab_id, str(game.level))
+        level_data = smoothed.get(key)
+        if level_data is None:
+            level_data = smoothed[key] = {"ema": game.score, "games_played": 1}
+            windows[key] = deque([game.score], maxlen=period)
+            continue
+
+        if smoother == "ema":
+            level_data["ema"] = alpha * game.score + (1 - alpha) * level_data["ema"]
+        else:
+            window = windows[key]
+            window.append(game.score)
+            level_data["ema"] = sum(window) / len(window)
+        level_data["games_played"] += 1
+    return smoothed
+
+
+class ScoreHistory:
+    """
+    Append-only game history of every player, in fixed-size binary records.
+
+    Each player has a file of 16-byte records (timestamp, vocabulary index,
+    level, score); vocabulary identifiers are stored once, in a shared
+    table. Recording a game appends a single record, and a whole history is
+    read back with one read. Records are appended in one write each, and the
+    table is only extended under a file lock, so several processes can share
+    the history.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory (Path): Directory holding the history files
+        """
+        self.directory = Path(directory)
+        self.vocabulary_file = self.directory / "vocabularies.json"
+        self.vocabulary_lock = self.directory / "vocabularies.lock"
+        self._vocabularies = None  # index -> vocabulary identifier
+        self._vocabulary_index = {}
+
+    def _path(self, player_name) -> Path:
+        return self.directory / f"{player_name}.bin"
+
+    def _load_vocabularies(self, reload=False):
+        if self._vocabularies is None or reload:
+            try:
+                with open(self.vocabulary_file, "r", encoding="utf-8") as file:
+                    self._vocabularies = json.load(file)
+            except FileNotFoundError:
+                self._vocabularies = []
+            self._vocabulary_index = {
+                vocab_id: index for index, vocab_id in enumerate(self._vocabularies)
+            }
+        return self._vocabularies
+
+    def _vocabulary(self, vocab_id) -> int:
+        """Index of a vocabulary identifier, added to the table if new."""
+        self._load_vocabularies()
+        index = self._vocabulary_index.get(vocab_id)
+        if index is not None:
+            return index
+
+        with FileLock(self.vocabulary_lock):
+            # Another process may have added it, or other vocabularies
+            self._load_vocabularies(reload=True)
+            index = self._vocabulary_index.get(vocab_id)
+            if index is None:
+                index = self._vocabulary_index[vocab_id] = len(self._vocabularies)
+                self._vocabularies.append(vocab_id)
+                tmp_file = self.vocabulary_file.with_suffix(".json.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as file:
+                    json.dump(self._vocabularies, file, ensure_ascii=False)
+                os.replace(tmp_file, self.vocabulary_file)
+        return index
+
+    def append(self, player_name, game: GameRecord) -> None:
+        """Append a game to the history of a player."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = RECORD.pack(
+            game.played_at, self._vocabulary(game.vocab_id), game.level, game.score
+        )
+        with open(self._path(player_name), "ab") as file:
+            file.write(record)
+
+    def load(self, player_name) -> list:
+        """Return the games of a player, oldest first."""
+        try:
+            with open(self._path(player_name), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return []
+
+        # A record cut short by a crash can only be the last one
+        data = data[: len(data) - len(data) % RECORD.size]
+        try:
+            return self._decode(data, self._load_vocabularies())
+        except IndexError:
+            # Vocabularies added by another process since the table was read
+            return self._decode(data, self._load_vocabularies(reload=True))
+
+    @staticmethod
+    def _decode(data, vocabularies) -> list:
+        return [
+            GameRecord(played_at, vocabularies[vocab], level, score)
+            for played_at, vocab, level, score in RECORD.iter_unpack(data)
+        ]
+
+    def players(self) -> list:
+        """Names of the players having a history."""
+        return sorted(path.stem for path in self.directory.glob("*.bin"))
@@ -1,59 +1,76 @@
-import json
-import os
 from datetime import datetime
-from pathlib import Path
 
-PLAYER_DIR = Path("./user_data")
+from models.json_storage import JsonStorage
+from models.score_history import GameRecord, ema_alpha, smooth_history
+from models.storage import Storage
 
 
 class ScoreModel:
-    def __init__(self, filename="player_scores.json", default_period=10):
+    def __init__(self, storage: Storage = None, default_period=7):
         """
         Initialize the score manager.
 
         Args:
-            filename: JSON file to store scores.
-            default_period: Default period for EMA calculation.
+            storage: Storage of the scores, JSON files by default.
+            default_period: Default period for EMA calculation, in games
+                (7 gives the historical smoothing factor of 0.25).
         """
-        self.filename = PLAYER_DIR / filename
+        self.storage = storage or JsonStorage()
         self.default_period = default_period
-        self.scores = self._load_scores()
-        self._load_players_with_scores()
-        self._read_player_availaible_levels()
-
-    def _load_scores(self):
-        """Load scores from JSON file, create if it doesn't exist."""
-        if os.path.exists(self.filename):
-            with open(self.filename, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
-
-    def _load_players_with_scores(self):
-        self.players_with_scores = list(self.scores.keys())
-
-    def _read_player_availaible_levels(self):
-        player_levels = {}
-        for player in self.scores:
-            player_levels[player] = []
-            for vocab in self.scores[player]["vocabularies"]:
-                for level in self.scores[player]["vocabularies"][vocab]["levels"]:
-                    if level not in player_levels[player]:
-                        player_levels[player].append(level)
-            player_levels[player] = sorted(player_levels[player], key=int)
-
-        self.player_levels = player_levels
-
-    def _save_scores(self):
-        """Save scores to JSON file."""
-        with open(self.filename, "w", encoding="utf-8") as f:
-            json.dump(self.scores, f, indent=4)
+        self.scores = {}  # player name -> scores, None if the player has none
+        # player name -> (levels, vocabularies) played, built once and added
+        # to on each save so showing stats never walks the scores again
+        self.player_levels = {}
 
-    def get_player_scores(self, player_name):
-        """Get all scores for a player."""
+    def _load_player_scores(self, player_name):
+        """Load the scores of a player from storage on first use."""
         if player_name not in self.scores:
+            self.scores[player_name] = self.storage.load_player_scores(player_name)
+        return self.scores[player_name]
+
+    @staticmethod
+    def _index_levels(player_data, levels, vocabularies):
+        """Add the levels and vocabularies of the scores to the index sets."""
+        for vocab_id, vocab_data in player_data["vocabularies"].items():
+            vocabularies.add(vocab_id)
+            levels.update(vocab_data["levels"])
+
+    def _read_player_availaible_levels(self, player_name, player_data):
+        """Index of the levels and vocabularies of a player, built once."""
+        index = self.player_levels.get(player_name)
+        if index is None:
+            index = self.player_levels[player_name] = (set(), set())
+            self._index_levels(player_data, *index)
+        return index
+
+    def _update_player_scores(self, player_name, update):
+        """
+        Apply an update to the stored scores of a player and keep the result.
+
+        The update is applied to the scores as they are in storage, which
+        include the games saved by other sessions since they were loaded.
+        """
+
+        def update_stored(player_data):
+            if player_data is None:
+                player_data = {"vocabularies": {}, "last_played": None}
+            update(player_data)
+            return player_data
+
+        self.scores[player_name] = self.storage.update_player_scores(
+            player_name, update_stored
+        )
+        # The stored scores may hold levels played in other sessions; levels
+        # are never removed, so adding the merged ones keeps the index right
+        index = self.player_levels.get(player_name)
+        if index is not None:
+            self._index_levels(self.scores[player_name], *index)
+        return self.scores[player_name]
+
+    def get_player_scores(self, player_name):
+        """Get all scores for a player, created empty (and unsaved) if missing."""
+        if self._load_player_scores(player_name) is None:
             self.scores[player_name] = {"vocabularies": {}, "last_played": None}
-            self._load_players_with_scores()
-            self._save_scores()
         return self.scores[player_name]
 
     def get_vocabulary_identifier(self, filenames):
@@ -86,7 +103,7 @@ class ScoreModel:
 
     def update_score(self, player_name, vocab_files, level, new_score, period=None):
         """
-        Update player's score using EMA.
+        Update player's score using EMA, and append the game to their history.
 
         Args:
             player_name: Name of the player.
@@ -99,35 +116,91 @@ class ScoreModel:
             period = self.default_period
 
         vocab_id = self.get_vocabulary_identifier(vocab_files)
-        player_data = self.get_player_scores(player_name)
-        vocab_data = self.ensure_vocabulary_scores(player_name, vocab_id)
-
-        # Ensure the level exists in the data
-        self.ensure_level_scores(vocab_data, level)
         level_str = str(level)
-        level_data = vocab_data["levels"][level_str]
+        alpha = ema_alpha(period)
+        now = datetime.now()
+
+        def add_game(player_data):
+            vocabularies = player_data["vocabularies"]
+            vocab_data = vocabularies.setdefault(vocab_id, {"levels": {}})
+
+            # Ensure the level exists in the data
+            self.ensure_level_scores(vocab_data, level)
+            level_data = vocab_data["levels"][level_str]
+
+            # Calculate EMA
+            if level_data["games_played"] == 0:
+                level_data["ema"] = new_score
+            else:
+                level_data["ema"] = (alpha * new_score) + (
+                    (1 - alpha) * level_data["ema"]
+                )
+
+            # Update statistics
+            level_data["games_played"] += 1
+            player_data["last_played"] = now.strftime("%Y-%m-%d %H:%M:%S")
+
+        player_data = self._update_player_scores(player_name, add_game)
+        self.storage.append_game(
+            player_name, GameRecord(int(now.timestamp()), vocab_id, level, new_score)
+        )
+        return player_data["vocabularies"][vocab_id]["levels"][level_str]["ema"]
+
+    def recompute_scores(self, player_names=None, period=None, smoother="ema"):
+        """
+        Recompute smoothed scores from the game history.
 
-        # Calculate EMA
-        alpha = 0.25
+        Only the vocabularies and levels whose every game is in the history
+        are replaced; scores including games played before the history
+        existed are kept as they are.
 
-        if level_data["games_played"] == 0:
-            level_data["ema"] = new_score
-        else:
-            level_data["ema"] = (alpha * new_score) + ((1 - alpha) * level_data["ema"])
-
-        # Update statistics
-        level_data["games_played"] += 1
-        player_data["last_played"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        Args:
+            player_names: Players to recompute, every player with a history
+                when None.
+            period: Smoothing period, in games (default_period when None).
+            smoother: "ema" or "sma", see smooth_history.
 
-        self._save_scores()
-        return level_data["ema"]
+        Returns:
+            int: Number of games replayed.
+        """
+        if period is None:
+            period = self.default_period
+        if player_names is None:
+            player_names = self.storage.history_players()
+
+        replayed = 0
+        for player_name in player_names:
+            games = self.storage.load_games(player_name)
+            if not games:
+                continue
+            replayed += len(games)
+            smoothed = smooth_history(games, period, smoother)
+
+            def replace_levels(player_data, smoothed=smoothed):
+                for (vocab_id, level), level_data in smoothed.items():
+                    vocabularies = player_data["vocabularies"]
+                    vocab_data = vocabularies.setdefault(vocab_id, {"levels": {}})
+                    current = vocab_data["levels"].get(level)
+                    if current and current["games_played"] > level_data["games_played"]:
+                        # Some games were played before the history existed
+                        continue
+                    vocab_data["levels"][level] = level_data
+
+            self._update_player_scores(player_name, replace_levels)
+
+        return replayed
+
+    def flush(self):
+        """Wait until the scores, and every other queued write, are saved."""
+        self.storage.flush()
 
     def get_display_data(self, player_name):
         """Returns data needed to render the score table."""
-        if player_name not in self.players_with_scores:
-            return None, None
-
-        player_data = self.get_player_scores(player_name)
-        self._read_player_availaible_levels()
-        levels = self.player_levels[player_name]
-        return player_data, levels
+        player_data = self._load_player_scores(player_name)
+        if player_data is None:
+            return None, None, None
+
+        levels, vocabularies = self._read_player_availaible_levels(
+            player_name, player_data
+        )
+        return player_data, sorted(levels, key=int), sorted(vocabularies)
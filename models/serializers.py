@@ -0,0 +1,108 @@
+import io
+import json
+import os
+import pickle
+from pathlib import Path
+
+# Files in the binary format start with this header; anything else is JSON
+BINARY_MAGIC = b"QYZBIN1\n"
+
+FORMATS = ("json", "compact", "fast", "binary")
+
+# Smaller files are read by the json module, orjson is only imported for
+# files large enough to repay its import
+ORJSON_MINIMUM_SIZE = 64 * 1024
+
+_orjson = False  # not imported yet
+
+
+def orjson():
+    """The orjson module, imported on first use; None when not installed."""
+    global _orjson
+    if _orjson is False:
+        try:
+            import orjson as module
+        except ImportError:  # optional, only makes the "fast" format faster
+            module = None
+        _orjson = module
+    return _orjson
+
+
+class _DataUnpickler(pickle.Unpickler):
+    """
+    Unpickler loading only builtin containers and scalars.
+
+    Any other object needs a global to be looked up, which is refused, so a
+    crafted file can not run code when it is read.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(
+            f"Global '{module}.{name}' is not allowed in user data."
+        )
+
+
+def dumps(data, data_format: str = "json") -> bytes:
+    """
+    Serialize data in one of the user data formats.
+
+    Args:
+        data: JSON compatible data
+        data_format (str): "json" (indented, the historical format),
+            "compact" (JSON without whitespace), "fast" (compact JSON written
+            by orjson when installed) or "binary" (pickle behind a header)
+
+    Returns:
+        bytes: The serialized data
+    """
+    if data_format == "json":
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    if data_format == "fast" and orjson() is not None:
+        return orjson().dumps(data)
+    if data_format in ("compact", "fast"):
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
+    if data_format == "binary":
+        return BINARY_MAGIC + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    raise ValueError(f"Unknown user data format '{data_format}'.")
+
+
+def loads(raw: bytes):
+    """
+    Deserialize data written by dumps, whatever its format.
+
+    The format is told by the header, so files stay readable after the
+    configured format changes. Binary data is read by _DataUnpickler.
+    """
+    if raw.startswith(BINARY_MAGIC):
+        return _DataUnpickler(io.BytesIO(raw[len(BINARY_MAGIC) :])).load()
+    if len(raw) >= ORJSON_MINIMUM_SIZE and orjson() is not None:
+        return orjson().loads(raw)
+    return json.loads(raw)
+
+
+def read_file(path: Path):
+    """Read a user data file in any format."""
+    with open(path, "rb") as file:
+        return loads(file.read())
+
+
+def write_file(path: Path, data, data_format: str = "json", durable=False) -> None:
+    """
+    Write a user data file atomically, through a temporary file.
+
+    Args:
+        path (Path): Destination
+        data: JSON compatible data
+        data_format (str): Format, see dumps
+        durable (bool): Flush the data to disk before replacing the file
+    """
+    path = Path(path)
+    raw = dumps(data, data_format)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(raw)
+        if durable:
+            file.flush()
+            os.fsync(file.fileno())
+    os.replace(tmp_path, path)
@@ -0,0 +1,193 @@
+import heapq
+import logging
+import math
+import os
+import pickle
+import unicodedata
+from pathlib import Path
+
+INDEX_FILE = Path("./user_data/cache/similarity_index.pickle")
+
+# Bump whenever the layout of the persisted index changes
+INDEX_VERSION = 1
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and strip accents and macrons (fīlius -> filius)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _trigrams(text: str):
+    padded = f"  {_normalize(text)} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def word_profile(word_data) -> frozenset:
+    """
+    Character trigrams of the Latin word and of its translation.
+
+    Both sets are kept apart (tagged 0 and 1) so that a Latin trigram never
+    matches a trigram of a translation.
+    """
+    return frozenset(
+        [(0, gram) for gram in _trigrams(word_data.word)]
+        + [(1, gram) for gram in _trigrams(word_data.translation)]
+    )
+
+
+class SimilarityIndex:
+    """
+    Nearest neighbours of every word of the corpus, by spelling.
+
+    Two words are close when their Latin words or their translations share
+    many character trigrams (cosine similarity of the trigram sets). Scores
+    are accumulated through an inverted index from trigram to words, so
+    only pairs sharing at least one trigram are ever compared; trigrams
+    found in too many words carry no information and are skipped.
+
+    The index is persisted and refreshed chapter by chapter: only the words
+    of files whose size or mtime changed are profiled and scored again.
+    """
+
+    def __init__(
+        self,
+        catalog,
+        path: Path = INDEX_FILE,
+        neighbors: int = 25,
+        max_document_frequency: float = 0.05,
+    ):
+        """
+        Args:
+            catalog (VocabularyCatalog): Source of the words
+            path (Path): Location of the persisted index
+            neighbors (int): Number of neighbours kept per word
+            max_document_frequency (float): Share of the words above which a
+                trigram is ignored
+        """
+        self.catalog = catalog
+        self.path = Path(path)
+        self.k = neighbors
+        self.max_document_frequency = max_document_frequency
+
+        self.files = {}  # filename -> (size, mtime_ns)
+        self.word_file = {}  # word ID -> filename
+        self.profiles = {}  # word ID -> trigram set
+        self.neighbors = {}  # word ID -> [(score, word ID)], best first
+
+        self._read()
+        self.refresh()
+
+    def _read(self) -> None:
+        try:
+            with open(self.path, "rb") as file:
+                data = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        if data.get("version") != INDEX_VERSION or data.get("k") != self.k:
+            return
+        self.files = data["files"]
+        self.word_file = data["word_file"]
+        self.profiles = data["profiles"]
+        self.neighbors = data["neighbors"]
+
+    def _write(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "k": self.k,
+            "files": self.files,
+            "word_file": self.word_file,
+            "profiles": self.profiles,
+            "neighbors": self.neighbors,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Could not write similarity index {self.path}: {e}")
+
+    def _signature(self, filename):
+        file_manifest = self.catalog.manifest[filename]
+        return file_manifest.size, file_manifest.mtime_ns
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the chapters of the catalog."""
+        current = {name: self._signature(name) for name in self.catalog.files}
+        changed = {
+            name
+            for name in set(current) | set(self.files)
+            if current.get(name) != self.files.get(name)
+        }
+        if not changed:
+            return
+
+        # Forget every word of the changed chapters
+        removed = {w for w, name in self.word_file.items() if name in changed}
+        for word_id in removed:
+            del self.word_file[word_id]
+            del self.profiles[word_id]
+            self.neighbors.pop(word_id, None)
+
+        added = set()
+        for filename in changed & set(current):
+            for word_id, word_data in self.catalog.words(filename).items():
+                self.word_file[word_id] = filename
+                self.profiles[word_id] = word_profile(word_data)
+                added.add(word_id)
+
+        # Words that lost a neighbour must be scored again from scratch; the
+        # others keep their list and only merge scores against new words.
+        stale = {
+            word_id
+            for word_id, ranked in self.neighbors.items()
+            if any(other in removed for _, other in ranked)
+        }
+        postings = self._postings()
+
+        for word_id in added | stale:
+            self.neighbors[word_id] = self._rank(word_id, postings)
+
+        for word_id in added:
+            for score, other in self._scores(word_id, postings):
+                if other in added or other in stale:
+                    continue
+                ranked = self.neighbors.setdefault(other, [])
+                ranked.append((score, word_id))
+                ranked.sort(reverse=True)
+                del ranked[self.k :]
+
+        self.files = current
+        self._write()
+
+    def _postings(self) -> dict:
+        """Inverted index from trigram to words, without overly common ones."""
+        postings = {}
+        for word_id, profile in self.profiles.items():
+            for gram in profile:
+                postings.setdefault(gram, []).append(word_id)
+
+        limit = max(2, int(len(self.profiles) * self.max_document_frequency))
+        return {gram: ids for gram, ids in postings.items() if len(ids) <= limit}
+
+    def _scores(self, word_id, postings):
+        """Cosine similarity with every word sharing a trigram."""
+        profile = self.profiles[word_id]
+        shared = {}
+        for gram in profile:
+            for other in postings.get(gram, ()):
+                if other != word_id:
+                    shared[other] = shared.get(other, 0) + 1
+
+        size = len(profile)
+        for other, count in shared.items():
+            yield count / math.sqrt(size * len(self.profiles[other])), other
+
+    def _rank(self, word_id, postings):
+        return heapq.nlargest(self.k, self._scores(word_id, postings))
+
+    def similar(self, word_id):
+        """Return the IDs of the closest words, best first."""
+        return [other for _, other in self.neighbors.get(word_id, ())]
@@ -0,0 +1,268 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import List, Optional
+
+from models.mastery_table import MasteryTable
+from models.score_history import GameRecord
+from models.storage import Storage
+
+DATABASE_FILE = Path("./user_data/quyzz.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS mastery (
+    player TEXT NOT NULL,
+    word_id INTEGER NOT NULL,
+    correct_attempts INTEGER NOT NULL,
+    total_attempts INTEGER NOT NULL,
+    schedule TEXT,
+    PRIMARY KEY (player, word_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS score_players (
+    player TEXT PRIMARY KEY,
+    last_played TEXT
+);
+CREATE TABLE IF NOT EXISTS scores (
+    player TEXT NOT NULL,
+    vocabulary TEXT NOT NULL,
+    level TEXT NOT NULL,
+    ema REAL NOT NULL,
+    games_played INTEGER NOT NULL,
+    PRIMARY KEY (player, vocabulary, level)
+);
+CREATE TABLE IF NOT EXISTS games (
+    player TEXT NOT NULL,
+    played_at INTEGER NOT NULL,
+    vocabulary TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    score REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_player ON games (player);
+"""
+
+# Statements are constant so that sqlite3 prepares each of them only once
+SELECT_PLAYERS = "SELECT name FROM players ORDER BY id"
+INSERT_PLAYER = "INSERT OR IGNORE INTO players (name) VALUES (?)"
+SELECT_MASTERY = (
+    "SELECT word_id, correct_attempts, total_attempts, schedule "
+    "FROM mastery WHERE player = ?"
+)
+UPSERT_MASTERY = (
+    "INSERT INTO mastery "
+    "(player, word_id, correct_attempts, total_attempts, schedule) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (player, word_id) DO UPDATE SET "
+    "correct_attempts = excluded.correct_attempts, "
+    "total_attempts = excluded.total_attempts, "
+    "schedule = excluded.schedule"
+)
+ADD_MASTERY = (
+    "INSERT INTO mastery "
+    "(player, word_id, correct_attempts, total_attempts, schedule) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (player, word_id) DO UPDATE SET "
+    "correct_attempts = correct_attempts + excluded.correct_attempts, "
+    "total_attempts = total_attempts + excluded.total_attempts, "
+    "schedule = coalesce(excluded.schedule, schedule)"
+)
+SELECT_SCORE_PLAYERS = "SELECT player, last_played FROM score_players ORDER BY rowid"
+SELECT_SCORES = (
+    "SELECT player, vocabulary, level, ema, games_played FROM scores ORDER BY rowid"
+)
+SELECT_PLAYER_LAST_PLAYED = "SELECT last_played FROM score_players WHERE player = ?"
+SELECT_PLAYER_SCORES = (
+    "SELECT vocabulary, level, ema, games_played FROM scores "
+    "WHERE player = ? ORDER BY rowid"
+)
+UPSERT_SCORE_PLAYER = (
+    "INSERT INTO score_players (player, last_played) VALUES (?, ?) "
+    "ON CONFLICT (player) DO UPDATE SET last_played = excluded.last_played"
+)
+INSERT_GAME = (
+    "INSERT INTO games (player, played_at, vocabulary, level, score) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SELECT_GAMES = (
+    "SELECT played_at, vocabulary, level, score FROM games "
+    "WHERE player = ? ORDER BY rowid"
+)
+SELECT_HISTORY_PLAYERS = "SELECT DISTINCT player FROM games ORDER BY player"
+UPSERT_SCORE = (
+    "INSERT INTO scores (player, vocabulary, level, ema, games_played) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT (player, vocabulary, level) DO UPDATE SET "
+    "ema = excluded.ema, games_played = excluded.games_played"
+)
+
+
+class SqliteStorage(Storage):
+    """
+    Storage in a single SQLite database.
+
+    The database runs in WAL mode so readers never block the writer. Mastery
+    is stored sparsely, one row per word a player has answered. Answers are
+    queued during a quiz and added to the stored counters in a single
+    transaction when the quiz ends, and scores are updated one player at a
+    time, so quizzes sharing the database never lose each other's answers.
+    Game results are appended to the games table.
+    """
+
+    def __init__(self, path: Path = DATABASE_FILE):
+        """
+        Args:
+            path (Path): Location of the database
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Other quizzes may hold the write lock while they save. The
+        # connection may be used by a write-behind thread, one call at a time
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+        # user name -> word ID -> [correct, total] answers since the last save
+        self._pending = {}
+
+    def close(self) -> None:
+        self._connection.close()
+
+    # Players
+
+    def load_players(self) -> Optional[List[str]]:
+        players = [name for (name,) in self._connection.execute(SELECT_PLAYERS)]
+        return players or None
+
+    def save_players(self, players: List[str]) -> None:
+        with self._connection:
+            self._connection.executemany(INSERT_PLAYER, ((name,) for name in players))
+
+    # Mastery
+
+    def load_mastery(self, user_name: str) -> MasteryTable:
+        records = {}
+        for word_id, correct, total, schedule in self._connection.execute(
+            SELECT_MASTERY, (user_name,)
+        ):
+            records[word_id] = {"correct_attempts": correct, "total_attempts": total}
+            if schedule:
+                records[word_id].update(json.loads(schedule))
+        return MasteryTable.from_dict(records)
+
+    def record_answer(
+        self, user_name: str, mastery_data: MasteryTable, word_id, is_correct: bool
+    ) -> None:
+        """Queue the answer; it is added to the row by the next save_mastery."""
+        counts = self._pending.setdefault(user_name, {}).setdefault(word_id, [0, 0])
+        counts[0] += int(is_correct)
+        counts[1] += 1
+
+    def save_mastery(self, user_name: str, mastery_data: MasteryTable) -> None:
+        """Add the answers given since the last save to the stored counters."""
+        rows = []
+        for word_id, (correct, total) in self._pending.pop(user_name, {}).items():
+            schedule = mastery_data.schedules.get(word_id)
+            rows.append(
+                (
+                    user_name,
+                    word_id,
+                    correct,
+                    total,
+                    json.dumps(schedule) if schedule else None,
+                )
+            )
+        if rows:
+            with self._connection:
+                self._connection.executemany(ADD_MASTERY, rows)
+
+    def write_mastery(self, user_name: str, mastery_data: MasteryTable, word_ids):
+        """Overwrite the rows of the given words in a single transaction."""
+        rows = []
+        for word_id in word_ids:
+            correct, total = mastery_data.attempts(word_id)
+            schedule = mastery_data.schedules.get(word_id)
+            rows.append(
+                (
+                    user_name,
+                    word_id,
+                    correct,
+                    total,
+                    json.dumps(schedule) if schedule else None,
+                )
+            )
+        if rows:
+            with self._connection:
+                self._connection.executemany(UPSERT_MASTERY, rows)
+
+    # Scores
+
+    def load_scores(self) -> dict:
+        scores = {}
+        for player, last_played in self._connection.execute(SELECT_SCORE_PLAYERS):
+            scores[player] = {"vocabularies": {}, "last_played": last_played}
+        for player, vocabulary, level, ema, games_played in self._connection.execute(
+            SELECT_SCORES
+        ):
+            vocabularies = scores[player]["vocabularies"]
+            levels = vocabularies.setdefault(vocabulary, {"levels": {}})["levels"]
+            levels[level] = {"ema": ema, "games_played": games_played}
+        return scores
+
+    def load_player_scores(self, player_name: str) -> Optional[dict]:
+        row = self._connection.execute(
+            SELECT_PLAYER_LAST_PLAYED, (player_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        player_data = {"vocabularies": {}, "last_played": row[0]}
+        for vocabulary, level, ema, games_played in self._connection.execute(
+            SELECT_PLAYER_SCORES, (player_name,)
+        ):
+            vocabularies = player_data["vocabularies"]
+            levels = vocabularies.setdefault(vocabulary, {"levels": {}})["levels"]
+            levels[level] = {"ema": ema, "games_played": games_played}
+        return player_data
+
+    def save_player_scores(self, player_name: str, player_data: dict) -> None:
+        rows = [
+            (player_name, vocabulary, level, data["ema"], data["games_played"])
+            for vocabulary, vocab_data in player_data["vocabularies"].items()
+            for level, data in vocab_data["levels"].items()
+        ]
+        with self._connection:
+            self._connection.execute(
+                UPSERT_SCORE_PLAYER, (player_name, player_data["last_played"])
+            )
+            self._connection.executemany(UPSERT_SCORE, rows)
+
+    def update_player_scores(self, player_name: str, update) -> dict:
+        """Read, update and write the scores in one immediate transaction."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            player_data = update(self.load_player_scores(player_name))
+            self.save_player_scores(player_name, player_data)
+        except BaseException:
+            self._connection.rollback()
+            raise
+        return player_data
+
+    # Game history
+
+    def append_game(self, player_name: str, game: GameRecord) -> None:
+        with self._connection:
+            self._connection.execute(INSERT_GAME, (player_name, *game))
+
+    def load_games(self, player_name: str) -> List[GameRecord]:
+        return [
+            GameRecord(*row)
+            for row in self._connection.execute(SELECT_GAMES, (player_name,))
+        ]
+
+    def history_players(self) -> List[str]:
+        return [name for (name,) in self._connection.execute(SELECT_HISTORY_PLAYERS)]
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from models.mastery_table import MasteryTable
+from models.score_history import GameRecord
+
+
+class Storage(ABC):
+    """
+    Persistence of the players, their mastery data and their scores.
+
+    PlayerModel, MasteryModel and ScoreModel keep their data in memory and
+    go through a Storage to read and write it, so the on-disk format can be
+    swapped without touching them.
+    """
+
+    # Players
+
+    @abstractmethod
+    def load_players(self) -> Optional[List[str]]:
+        """Return the saved player names, None if none were ever saved."""
+
+    @abstractmethod
+    def save_players(self, players: List[str]) -> None:
+        """Save the player names, keeping the ones saved by other sessions."""
+
+    # Mastery
+
+    @abstractmethod
+    def load_mastery(self, user_name: str) -> MasteryTable:
+        """
+        Load the mastery data of a player, without writing anything.
+
+        Args:
+            user_name (str): Name of the player
+
+        Returns:
+            MasteryTable: Mastery data of the player
+        """
+
+    @abstractmethod
+    def record_answer(
+        self, user_name: str, mastery_data: MasteryTable, word_id, is_correct: bool
+    ) -> None:
+        """Persist, or queue, an answer already counted in the mastery data."""
+
+    def record_answers(
+        self, user_name: str, mastery_data: MasteryTable, answers
+    ) -> None:
+        """
+        Persist several answers at once, see record_answer.
+
+        Args:
+            user_name (str): Name of the player
+            mastery_data (MasteryTable): Mastery data holding the answers
+            answers (list): (word ID, whether the answer was right), in the
+                order they were given
+        """
+        for word_id, is_correct in answers:
+            self.record_answer(user_name, mastery_data, word_id, is_correct)
+
+    @abstractmethod
+    def save_mastery(self, user_name: str, mastery_data: MasteryTable) -> None:
+        """
+        Make every recorded answer of a player durable, adding them to the
+        answers other sessions saved meanwhile.
+        """
+
+    # Scores
+
+    @abstractmethod
+    def load_scores(self) -> dict:
+        """Return the scores of every player, keyed by player name."""
+
+    @abstractmethod
+    def load_player_scores(self, player_name: str) -> Optional[dict]:
+        """Return the scores of a single player, None if they have none."""
+
+    @abstractmethod
+    def save_player_scores(self, player_name: str, player_data: dict) -> None:
+        """Save the scores of a single player."""
+
+    def update_player_scores(self, player_name: str, update) -> dict:
+        """
+        Change the scores of a player as they are in storage.
+
+        Backends shared between processes make the read and the write a
+        single atomic step, so games saved by other sessions are kept.
+
+        Args:
+            player_name (str): Name of the player
+            update (callable): Takes the stored scores of the player, None if
+                they have none, and returns them changed
+
+        Returns:
+            dict: The scores saved
+        """
+        player_data = update(self.load_player_scores(player_name))
+        self.save_player_scores(player_name, player_data)
+        return player_data
+
+    # Game history
+
+    @abstractmethod
+    def append_game(self, player_name: str, game: GameRecord) -> None:
+        """Append the result of a game to the history of a player."""
+
+    @abstractmethod
+    def load_games(self, player_name: str) -> List[GameRecord]:
+        """Return the games of a player, oldest first."""
+
+    @abstractmethod
+    def history_players(self) -> List[str]:
+        """Names of the players having a game history."""
+
+    def flush(self) -> None:
+        """Wait until every write is done, for storages writing in the background."""
+
+    def close(self) -> None:
+        """Release the resources held by the storage."""
+
+
+def open_storage(
+    backend: str = "json", data_format: str = "json", write_latency: float = 0
+) -> Storage:
+    """
+    Open the storage backend selected in the configuration.
+
+    Args:
+        backend (str): "json" for the files of user_data, "sqlite" for a
+            single SQLite database
+        data_format (str): Format of the files of the "json" backend, see
+            serializers
+        write_latency (float): Seconds the writes may be delayed to be done
+            by a background thread, 0 to write them at once
+
+    Returns:
+        Storage: The opened storage
+    """
+    if backend == "json":
+        from models.json_storage import JsonStorage
+
+        storage = JsonStorage(data_format=data_format)
+    elif backend == "sqlite":
+        from models.sqlite_storage import SqliteStorage
+
+        storage = SqliteStorage()
+    else:
+        raise ValueError(f"Unknown storage backend '{backend}'.")
+
+    if write_latency > 0:
+        from models.write_behind import WriteBehindStorage
+
+        storage = WriteBehindStorage(storage, write_latency)
+    return storage
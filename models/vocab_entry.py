@@ -0,0 +1,78 @@
+import sys
+from enum import Enum
+from typing import NamedTuple
+
+
+class WordCategory(Enum):
+    """Grammatical category of a vocabulary entry, independent of spelling."""
+
+    NOUN = "noun"
+    PROPER_NOUN = "proper_noun"
+    VERB = "verb"
+    ADJECTIVE = "adjective"
+    ADVERB = "adverb"
+    PRONOUN = "pronoun"
+    NUMERAL = "numeral"
+    PREPOSITION = "preposition"
+    CONJUNCTION = "conjunction"
+    PARTICLE = "particle"
+    INTERJECTION = "interjection"
+    OTHER = "other"
+
+
+# Word types found in the vocabulary files, several spellings per category
+_CATEGORY_BY_WORD_TYPE = {
+    "zelfstandig naamwoord": WordCategory.NOUN,
+    "substantief": WordCategory.NOUN,
+    "eigennaam": WordCategory.PROPER_NOUN,
+    "werkwoord": WordCategory.VERB,
+    "bijvoeglijk naamwoord": WordCategory.ADJECTIVE,
+    "adjectief": WordCategory.ADJECTIVE,
+    "bijwoord": WordCategory.ADVERB,
+    "bijwoord/voegwoord": WordCategory.ADVERB,
+    "voornaamwoord": WordCategory.PRONOUN,
+    "telwoord": WordCategory.NUMERAL,
+    "voorzetsel": WordCategory.PREPOSITION,
+    "voegwoord": WordCategory.CONJUNCTION,
+    "partikel": WordCategory.PARTICLE,
+    "tussenwerpsel": WordCategory.INTERJECTION,
+}
+
+
+class VocabEntry(NamedTuple):
+    """
+    A single vocabulary word.
+
+    Stored as a tuple, so an entry costs a fixed 5 pointers instead of a
+    per-word dict. Word types are interned: every entry of the same type
+    shares one string object.
+    """
+
+    word: str
+    form: str
+    translation: str
+    hint: str = ""
+    word_type: str = ""
+
+    @classmethod
+    def from_parts(cls, parts):
+        """
+        Build an entry from the fields of a vocabulary line, ID excluded.
+
+        Args:
+            parts (list): word, form, translation and optional hint and type
+        """
+        return cls(
+            parts[0],
+            parts[1],
+            parts[2],
+            parts[3] if len(parts) > 3 else "",
+            sys.intern(parts[4]) if len(parts) > 4 else "",
+        )
+
+    @property
+    def category(self) -> WordCategory:
+        """Grammatical category derived from the word type."""
+        return _CATEGORY_BY_WORD_TYPE.get(
+            self.word_type.strip().lower(), WordCategory.OTHER
+        )
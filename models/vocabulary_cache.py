@@ -0,0 +1,128 @@
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+CACHE_DIR = Path("./user_data/cache/vocabulary")
+
+# Bump whenever the layout of the cached payload changes
+CACHE_VERSION = 2
+
+
+class VocabularyCache:
+    """
+    On-disk cache of parsed vocabulary files.
+
+    Each vocabulary file gets its own pickle made of two consecutive records:
+    a small header describing the source file (size, mtime, content digest)
+    and the parsed payload. The header is checked first so a stale entry is
+    detected without unpickling the payload.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (Path): Directory holding the cached files
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _cache_path(self, source: Path) -> Path:
+        return self.cache_dir / f"{source.name}.pickle"
+
+    @staticmethod
+    def _digest(source: Path) -> str:
+        with open(source, "rb") as file:
+            return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+    def _read_header(self, cache_path: Path):
+        try:
+            with open(cache_path, "rb") as file:
+                header = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+            return None
+        return header
+
+    def _read_payload(self, cache_path: Path):
+        with open(cache_path, "rb") as file:
+            pickle.load(file)  # skip header
+            return pickle.load(file)
+
+    def _write(self, cache_path: Path, header: dict, payload) -> None:
+        """Write header and payload atomically next to the final location."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as file:
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+    def load(self, source: Path, parser):
+        """
+        Return the parsed content of a vocabulary file, from cache when valid.
+
+        The entry is reused as is when size and mtime are unchanged. When they
+        differ the content digest is compared, so a file that was only touched
+        (copied, checked out again) is not re-parsed.
+
+        Args:
+            source (Path): Vocabulary file to load
+            parser (callable): Function parsing the file when the cache misses
+
+        Returns:
+            The parsed payload, as returned by parser
+        """
+        source = Path(source)
+        stat = source.stat()
+        cache_path = self._cache_path(source)
+        header = self._read_header(cache_path)
+
+        if header is not None:
+            if (
+                header["size"] == stat.st_size
+                and header["mtime_ns"] == stat.st_mtime_ns
+            ):
+                try:
+                    return self._read_payload(cache_path)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    header = None
+
+        digest = self._digest(source)
+        if header is not None and header["digest"] == digest:
+            try:
+                payload = self._read_payload(cache_path)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                payload = None
+            if payload is not None:
+                header.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                self._store(cache_path, header, payload)
+                return payload
+
+        logging.debug(f"Vocabulary cache miss for {source.name}, parsing file.")
+        payload = parser(source)
+        header = {
+            "version": CACHE_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+        }
+        self._store(cache_path, header, payload)
+        return payload
+
+    def _store(self, cache_path: Path, header: dict, payload) -> None:
+        # A read-only or full disk must never prevent the quiz from starting
+        try:
+            self._write(cache_path, header, payload)
+        except OSError as e:
+            logging.warning(f"Could not write vocabulary cache {cache_path}: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached vocabulary file."""
+        if not self.cache_dir.exists():
+            return
+        for cache_path in self.cache_dir.glob("*.pickle"):
+            cache_path.unlink()
@@ -0,0 +1,215 @@
+import os
+from itertools import repeat
+from pathlib import Path
+
+from models.vocab_entry import VocabEntry
+from models.vocabulary_cache import VocabularyCache
+from models.vocabulary_manifest import VocabularyManifest
+
+
+def parse_vocabulary_file(path):
+    """
+    Parse a pipe-delimited vocabulary file.
+
+    Returns:
+        dict: "min_id" and "max_id" over every line with a valid word ID
+        (None when there is none) and "words", the complete entries by ID.
+    """
+    min_id, max_id = None, None
+    words = {}
+
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            parts = line.strip().split("|")
+            try:
+                word_id = int(parts[0])
+            except ValueError:
+                continue  # Skip lines with invalid word IDs
+
+            min_id = word_id if min_id is None else min(min_id, word_id)
+            max_id = word_id if max_id is None else max(max_id, word_id)
+
+            if len(parts) >= 5:
+                words[word_id] = VocabEntry.from_parts(parts[1:])
+
+    return {"min_id": min_id, "max_id": max_id, "words": words}
+
+
+class VocabularyCatalog:
+    """
+    In-memory view of the whole vocabulary corpus.
+
+    A single catalog is built at startup and shared by every component that
+    needs vocabulary data. Each file is parsed (or read from the on-disk
+    cache) at most once per process, the first time it is needed.
+
+    ID ranges, the set of IDs and range queries on files that were not
+    loaded yet are answered from the manifest, without parsing any file.
+
+    With ingest_workers above 1, files that are not loaded yet are read in
+    parallel when several of them are needed at once. Results are merged in
+    file order, so the outcome is identical to a sequential load.
+    """
+
+    def __init__(
+        self,
+        directory="./vocabularies",
+        cache: VocabularyCache = None,
+        manifest: VocabularyManifest = None,
+        ingest_workers: int = 0,
+        ingest_executor: str = "process",
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            directory (str | Path): Directory containing the vocabulary files
+            cache (VocabularyCache): Cache of parsed files
+            manifest (VocabularyManifest): Index of IDs and line offsets
+            ingest_workers (int): Number of parallel workers, 0 or 1 to load
+                files sequentially
+            ingest_executor (str): "process" or "thread" pool
+        """
+        if ingest_executor not in ("process", "thread"):
+            raise ValueError(f"Unknown ingest executor '{ingest_executor}'.")
+
+        self.directory = Path(directory)
+        self.cache = cache or VocabularyCache()
+        self.files = [f for f in os.listdir(self.directory) if f.endswith(".txt")]
+        self._manifest = manifest
+        self._manifest_checked = False
+        self.ingest_workers = ingest_workers
+        self.ingest_executor = ingest_executor
+        self._parsed = {}
+
+    @property
+    def manifest(self) -> VocabularyManifest:
+        """Manifest of the vocabulary files, brought up to date once per process."""
+        if self._manifest is None:
+            self._manifest = VocabularyManifest(self.directory)
+        if not self._manifest_checked:
+            self._manifest.refresh(self.files)
+            self._manifest_checked = True
+        return self._manifest
+
+    def _get(self, filename):
+        parsed = self._parsed.get(filename)
+        if parsed is None:
+            parsed = self.cache.load(self.directory / filename, parse_vocabulary_file)
+            self._parsed[filename] = parsed
+        return parsed
+
+    def ingest(self, filenames=None):
+        """
+        Make sure the given files are loaded, in parallel when enabled.
+
+        Args:
+            filenames (list): Files to load, all files when None
+        """
+        missing = [
+            f for f in dict.fromkeys(filenames or self.files) if f not in self._parsed
+        ]
+        if self.ingest_workers <= 1 or len(missing) <= 1:
+            for filename in missing:
+                self._get(filename)
+            return
+
+        # Imported here, as most runs never start a pool
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if self.ingest_executor == "process":
+            executor_class = ProcessPoolExecutor
+        else:
+            executor_class = ThreadPoolExecutor
+        paths = [self.directory / filename for filename in missing]
+        chunksize = max(1, len(paths) // (self.ingest_workers * 4))
+
+        with executor_class(max_workers=self.ingest_workers) as executor:
+            results = executor.map(
+                self.cache.load,
+                paths,
+                repeat(parse_vocabulary_file),
+                chunksize=chunksize,
+            )
+            for filename, parsed in zip(missing, results):
+                self._parsed[filename] = parsed
+
+    def id_range(self, filenames=None):
+        """
+        Determine the min and max word IDs across the given files.
+
+        Args:
+            filenames (list): Files to consider, all files when None
+
+        Returns:
+            tuple: (min_id, max_id)
+        """
+        manifest = self.manifest
+        ranges = [
+            (manifest[filename].min_id, manifest[filename].max_id)
+            for filename in filenames or self.files
+            if manifest[filename].min_id is not None
+        ]
+        if not ranges:
+            raise ValueError("No valid word IDs found in the provided files.")
+
+        return min(r[0] for r in ranges), max(r[1] for r in ranges)
+
+    def words(self, filename):
+        """Return the entries of one file, keyed by word ID, in file order."""
+        return self._get(filename)["words"]
+
+    def word_ids(self):
+        """Return the set of every word ID in the corpus."""
+        ids = set()
+        for filename in self.files:
+            ids.update(self.manifest[filename].ids)
+        return ids
+
+    def word_types(self):
+        """Return the sorted list of distinct word types in the corpus."""
+        types = set()
+        self.ingest()
+        for filename in self.files:
+            types.update(entry.word_type for entry in self.words(filename).values())
+        return sorted(types)
+
+    def load(self, filenames=None, custom_range=None):
+        """
+        Merge the entries of several files, optionally limited to an ID range.
+
+        With a range, files already in memory are filtered in place while the
+        others are read through the manifest: files outside the range are not
+        opened and only the matching lines of the others are read.
+
+        Args:
+            filenames (list): Files to merge, all files when None
+            custom_range (tuple): Optional inclusive (start, end) ID range
+
+        Returns:
+            dict: Entries keyed by word ID, sorted by ID
+        """
+        vocabulary = {}
+        if not custom_range:
+            self.ingest(filenames)
+
+        for filename in filenames or self.files:
+            if not custom_range:
+                words = self.words(filename)
+            elif filename in self._parsed:
+                start, end = custom_range
+                words = {
+                    word_id: word_data
+                    for word_id, word_data in self.words(filename).items()
+                    if start <= word_id <= end
+                }
+            else:
+                words = self.manifest.read_range(filename, *custom_range)
+            vocabulary.update(words)
+
+        # Ensure vocabulary is sorted by word_id
+        return dict(sorted(vocabulary.items()))
+
+    def slice(self, start, end):
+        """Return every entry of the corpus whose ID lies in [start, end]."""
+        return self.load(self.files, (start, end))
@@ -0,0 +1,185 @@
+import logging
+import os
+import pickle
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+
+from models.vocab_entry import VocabEntry
+
+MANIFEST_FILE = Path("./user_data/cache/vocabulary_manifest.pickle")
+
+# Bump whenever the layout of FileManifest changes
+MANIFEST_VERSION = 2
+
+
+class FileManifest:
+    """ID range and line offsets of a single vocabulary file."""
+
+    __slots__ = ("size", "mtime_ns", "min_id", "max_id", "ids", "offsets")
+
+    def __init__(self, size, mtime_ns, ids, offsets, min_id, max_id):
+        """
+        Args:
+            size (int): Size of the file when it was indexed
+            mtime_ns (int): Modification time of the file when it was indexed
+            ids (array): Sorted IDs of the complete entries of the file
+            offsets (array): Byte offset of the line holding each entry
+            min_id (int): Smallest valid ID of any line, None if there is none
+            max_id (int): Largest valid ID of any line, None if there is none
+        """
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.ids = ids
+        self.offsets = offsets
+        self.min_id = min_id
+        self.max_id = max_id
+
+    def __getstate__(self):
+        return (
+            self.size,
+            self.mtime_ns,
+            self.ids,
+            self.offsets,
+            self.min_id,
+            self.max_id,
+        )
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def build(cls, path: Path):
+        """
+        Scan a vocabulary file and record the offset of every entry.
+
+        Like parse_vocabulary_file, the ID range covers every line with a
+        valid ID, while only lines with all the fields of an entry are
+        indexed, the last one winning when an ID repeats.
+        """
+        stat = path.stat()
+        line_of = {}
+        min_id, max_id = None, None
+        offset = 0
+        with open(path, "rb") as file:
+            for line in file:
+                parts = line.split(b"|")
+                try:
+                    word_id = int(parts[0])
+                except ValueError:
+                    word_id = None
+                if word_id is not None:
+                    min_id = word_id if min_id is None else min(min_id, word_id)
+                    max_id = word_id if max_id is None else max(max_id, word_id)
+                    if len(parts) >= 5:
+                        line_of[word_id] = offset
+                offset += len(line)
+
+        ids = array("q", sorted(line_of))
+        offsets = array("Q", (line_of[word_id] for word_id in ids))
+        return cls(stat.st_size, stat.st_mtime_ns, ids, offsets, min_id, max_id)
+
+    def is_current(self, path: Path) -> bool:
+        stat = path.stat()
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        return self.min_id is not None and start <= self.max_id and end >= self.min_id
+
+    def read_range(self, path: Path, start: int, end: int) -> dict:
+        """
+        Read the entries whose ID lies in [start, end] straight from the file.
+
+        Only the matching lines are read: the file is positioned on each of
+        them in file order, so a contiguous range costs a single seek.
+
+        Returns:
+            dict: Entries keyed by word ID
+        """
+        low = bisect_left(self.ids, start)
+        high = bisect_right(self.ids, end)
+        if low == high:
+            return {}
+
+        words = {}
+        position = None
+        with open(path, "rb") as file:
+            for offset in sorted(self.offsets[low:high]):
+                if offset != position:
+                    file.seek(offset)
+                line = file.readline()
+                position = offset + len(line)
+
+                parts = line.decode("utf-8").strip().split("|")
+                if len(parts) >= 5:
+                    words[int(parts[0])] = VocabEntry.from_parts(parts[1:])
+        return words
+
+
+class VocabularyManifest:
+    """
+    Persistent index of every vocabulary file of a directory.
+
+    Keeps, for each file, its ID range and the offset of each line, so a
+    range query can skip files that do not overlap and seek directly to the
+    matching lines. Entries are refreshed when a file size or mtime changes.
+    """
+
+    def __init__(self, directory: Path, path: Path = MANIFEST_FILE):
+        """
+        Args:
+            directory (Path): Directory containing the vocabulary files
+            path (Path): Location of the persisted manifest
+        """
+        self.directory = Path(directory)
+        self.path = Path(path)
+        self.files = self._read()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "rb") as file:
+                version, files = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return {}
+        return files if version == MANIFEST_VERSION else {}
+
+    def _write(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "wb") as file:
+                pickle.dump(
+                    (MANIFEST_VERSION, self.files),
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Could not write vocabulary manifest {self.path}: {e}")
+
+    def refresh(self, filenames) -> None:
+        """Re-index the given files when they changed, and forget the others."""
+        changed = False
+        for filename in filenames:
+            path = self.directory / filename
+            current = self.files.get(filename)
+            if current is None or not current.is_current(path):
+                self.files[filename] = FileManifest.build(path)
+                changed = True
+
+        for filename in set(self.files) - set(filenames):
+            del self.files[filename]
+            changed = True
+
+        if changed:
+            self._write()
+
+    def __getitem__(self, filename) -> FileManifest:
+        return self.files[filename]
+
+    def read_range(self, filename, start: int, end: int) -> dict:
+        """Read the entries of one file whose ID lies in [start, end]."""
+        file_manifest = self.files[filename]
+        if not file_manifest.overlaps(start, end):
+            return {}
+        return file_manifest.read_range(self.directory / filename, start, end)
@@ -1,57 +1,57 @@
-import os
-from pathlib import Path
+from models.columnar_vocabulary import ColumnarVocabularyStore
+from models.similarity_index import SimilarityIndex
+from models.vocabulary_catalog import VocabularyCatalog
+
+STORAGE_ENGINES = ("dict", "columnar")
 
 
 class VocabularyModel:
-    def __init__(self, directory="./vocabularies"):
-        self.directory = Path(directory)
+    def __init__(self, catalog: VocabularyCatalog = None, storage: str = "dict"):
+        """
+        Initialize the vocabulary model.
+
+        Args:
+            catalog (VocabularyCatalog): Shared vocabulary catalog
+            storage (str): "dict" to load entries in memory, "columnar" to
+                serve them lazily from a memory-mapped columnar file
+        """
+        if storage not in STORAGE_ENGINES:
+            raise ValueError(f"Unknown vocabulary storage '{storage}'.")
+
+        self.catalog = catalog or VocabularyCatalog()
+        self.directory = self.catalog.directory
+        self.storage = storage
+        self._store = None
+        self._similarity_index = None
         self.data = {}
 
+    @property
+    def files(self):
+        """Names of the vocabulary files available in the catalog."""
+        return self.catalog.files
+
+    @property
+    def store(self) -> ColumnarVocabularyStore:
+        """Columnar store, opened (and rebuilt if stale) on first use."""
+        if self._store is None:
+            self._store = ColumnarVocabularyStore.open_for(self.catalog)
+        return self._store
+
+    @property
+    def similarity_index(self) -> SimilarityIndex:
+        """Spelling similarity index of the corpus, refreshed on first use."""
+        if self._similarity_index is None:
+            self._similarity_index = SimilarityIndex(self.catalog)
+        return self._similarity_index
+
     def get_word_id_range(self, filenames):
         """Determine the min and max word IDs across all files."""
-        min_id, max_id = float("inf"), float("-inf")
-
-        for filename in filenames:
-            with open(self.directory / filename, "r", encoding="utf-8") as file:
-                for line in file:
-                    parts = line.strip().split("|")
-                    if len(parts) >= 1:
-                        try:
-                            word_id = int(parts[0])
-                            min_id = min(min_id, word_id)
-                            max_id = max(max_id, word_id)
-                        except ValueError:
-                            continue  # Skip lines with invalid word IDs
-
-        if min_id == float("inf") or max_id == float("-inf"):
-            raise ValueError("No valid word IDs found in the provided files.")
-
-        return min_id, max_id
+        if self.storage == "columnar":
+            return self.store.id_range(filenames)
+        return self.catalog.id_range(filenames)
 
     def load(self, filenames, custom_range=None):
         """Load vocabulary from specified files and optional word ID range."""
-        vocabulary = {}
-
-        for filename in filenames:
-            with open(self.directory / filename, "r", encoding="utf-8") as file:
-                for line in file:
-                    parts = line.strip().split("|")
-                    if len(parts) >= 5:
-                        try:
-                            word_id = int(parts[0])
-                            if custom_range:
-                                start, end = custom_range
-                                if not (start <= word_id <= end):
-                                    continue  # Skip words outside the range
-                            vocabulary[word_id] = {
-                                "word": parts[1],
-                                "form": parts[2],
-                                "translation": parts[3],
-                                "hint": parts[4] if len(parts) > 4 else "",
-                                "word_type": parts[5] if len(parts) > 5 else "",
-                            }
-                        except ValueError:
-                            continue  # Skip lines with invalid word IDs
-
-        # Ensure vocabulary is sorted by word_id
-        return dict(sorted(vocabulary.items()))
+        if self.storage == "columnar":
+            return self.store.view(filenames, custom_range)
+        return self.catalog.load(filenames, custom_range)
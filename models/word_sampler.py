@@ -0,0 +1,223 @@
+import random
+from collections import deque
+
+
+class WeightedSampler:
+    """
+    Weighted random sampling without replacement over integer weights.
+
+    Weights are kept in a Fenwick tree (binary indexed tree), so drawing a
+    key and changing a weight both cost O(log N) whatever the number of
+    keys. Drawn keys get a zero weight until restore() is called; once every
+    key has been drawn the sampler restores them and starts a new round.
+    """
+
+    def __init__(self, weights: dict):
+        """
+        Args:
+            weights (dict): Non-negative integer weight of each key
+        """
+        self._keys = list(weights)
+        self._index = {key: i for i, key in enumerate(self._keys)}
+        self._weights = [int(weight) for weight in weights.values()]
+        self._drawn = {}  # key -> weight to give back on restore
+
+        # Linear-time construction: push each node into its parent
+        size = len(self._weights)
+        self._tree = [0] + self._weights
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                self._tree[parent] += self._tree[i]
+
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    @property
+    def total(self) -> int:
+        """Sum of the weights of the keys not drawn yet."""
+        return self._prefix_sum(len(self._weights))
+
+    def _prefix_sum(self, position: int) -> int:
+        total = 0
+        while position > 0:
+            total += self._tree[position]
+            position -= position & -position
+        return total
+
+    def _add(self, index: int, delta: int) -> None:
+        self._weights[index] += delta
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def _find(self, target: int) -> int:
+        """Index of the key whose cumulative weight range holds target."""
+        position = 0
+        bit = self._top_bit
+        while bit:
+            following = position + bit
+            if following < len(self._tree) and self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            bit >>= 1
+        return position
+
+    def weight(self, key) -> int:
+        """Weight of a key, as it will be once restored if it was drawn."""
+        if key in self._drawn:
+            return self._drawn[key]
+        return self._weights[self._index[key]]
+
+    def set_weight(self, key, weight: int) -> None:
+        """Change the weight of a key; a drawn key gets it back on restore."""
+        if key in self._drawn:
+            self._drawn[key] = int(weight)
+            return
+        index = self._index[key]
+        self._add(index, int(weight) - self._weights[index])
+
+    def draw(self, rng=random):
+        """
+        Draw a key with probability proportional to its weight and take it
+        out of the sampler until the next restore.
+
+        Args:
+            rng (random.Random): Source of randomness
+
+        Returns:
+            The drawn key
+        """
+        total = self.total
+        if total == 0:
+            self.restore()
+            total = self.total
+            if total == 0:
+                raise ValueError("Cannot draw from a sampler with no weight.")
+
+        index = self._find(rng.randrange(total))
+        key = self._keys[index]
+        self._drawn[key] = self._weights[index]
+        self._add(index, -self._weights[index])
+        return key
+
+    def restore(self) -> None:
+        """Put every drawn key back with its current weight."""
+        for key, weight in self._drawn.items():
+            index = self._index[key]
+            self._add(index, weight - self._weights[index])
+        self._drawn.clear()
+
+
+class UnplayedTracker:
+    """
+    Draws unplayed words first, in vocabulary order, then random played ones.
+
+    Unplayed words wait in a queue and played ones in a list with an index
+    map, so drawing, marking a word as played and putting words back all
+    cost O(1) (amortized), however many words were already played. It
+    follows the same draw()/restore() protocol as WeightedSampler.
+    """
+
+    def __init__(self, word_ids, unplayed):
+        """
+        Args:
+            word_ids (iterable): Word IDs to draw from, in vocabulary order
+            unplayed (callable): Tells whether a word ID was never played
+        """
+        self._order = {}
+        self._unplayed = set()
+        self._queue = deque()
+        self._played = []
+        self._played_index = {}
+        self._drawn = []
+        self._drawn_unplayed = set()  # drawn words still unplayed
+
+        for position, word_id in enumerate(word_ids):
+            self._order[word_id] = position
+            if unplayed(word_id):
+                self._unplayed.add(word_id)
+                self._queue.append(word_id)
+            else:
+                self._add_played(word_id)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, word_id):
+        return word_id in self._order
+
+    def _add_played(self, word_id):
+        self._played_index[word_id] = len(self._played)
+        self._played.append(word_id)
+
+    def _remove_played(self, index):
+        """Swap-remove the played word at index and return it."""
+        word_id = self._played[index]
+        last = self._played.pop()
+        if last != word_id:
+            self._played[index] = last
+            self._played_index[last] = index
+        del self._played_index[word_id]
+        return word_id
+
+    def _next_unplayed(self):
+        # Words played or drawn since they were queued are skipped lazily
+        while self._queue:
+            word_id = self._queue.popleft()
+            if word_id in self._unplayed:
+                self._unplayed.discard(word_id)
+                self._drawn_unplayed.add(word_id)
+                return word_id
+        return None
+
+    def draw(self, rng=random):
+        """
+        Draw the next unplayed word, or a random played one when none is left,
+        and take it out of the tracker until the next restore.
+
+        Args:
+            rng (random.Random): Source of randomness
+
+        Returns:
+            The drawn word ID
+        """
+        if not self._unplayed and not self._played:
+            self.restore()
+            if not self._unplayed and not self._played:
+                raise ValueError("Cannot draw from an empty tracker.")
+
+        word_id = self._next_unplayed()
+        if word_id is None:
+            word_id = self._remove_played(rng.randrange(len(self._played)))
+        self._drawn.append(word_id)
+        return word_id
+
+    def mark_played(self, word_id):
+        """Record that a word was answered; a drawn word stays out until restore."""
+        if word_id in self._unplayed:
+            self._unplayed.discard(word_id)
+            self._add_played(word_id)
+        else:
+            self._drawn_unplayed.discard(word_id)
+
+    def restore(self):
+        """Put every drawn word back, unplayed ones at the front of the queue."""
+        unplayed = []
+        for word_id in self._drawn:
+            if word_id in self._drawn_unplayed:
+                unplayed.append(word_id)
+            else:
+                self._add_played(word_id)
+        self._drawn.clear()
+        self._drawn_unplayed.clear()
+
+        unplayed.sort(key=self._order.get, reverse=True)
+        self._queue.extendleft(unplayed)
+        self._unplayed.update(unplayed)
@@ -0,0 +1,220 @@
+import copy
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from models.mastery_table import MasteryTable
+from models.score_history import GameRecord
+from models.storage import Storage
+
+# Order in which the queued operations of a batch are written: answers are
+# journaled before the mastery saves that fold them into the snapshot
+OPERATIONS = ("answer", "save_mastery", "scores", "game", "players")
+
+
+class WriteBehindStorage(Storage):
+    """
+    Storage whose writes are done by a background thread.
+
+    Answers, mastery saves, score updates and games are queued and the
+    call returns at once, so the quiz never waits for the disk. The thread
+    writes what was queued at most latency seconds later, coalescing it:
+    the answers of a player are recorded in one batch, repeated mastery
+    saves are done once, and the score updates of a player are applied in
+    a single read-merge-write.
+
+    Reads first wait for the queued writes, so they always see them. Score
+    updates return at once with the update applied to the scores last read.
+    """
+
+    def __init__(self, storage: Storage, latency: float = 0.5):
+        """
+        Args:
+            storage (Storage): Storage doing the writes
+            latency (float): Longest time, in seconds, a write stays queued
+        """
+        self.storage = storage
+        self.latency = latency
+        self._pending = []  # (operation, key, arguments), in call order
+        self._busy = False  # whether the thread is writing a batch
+        self._hurry = False  # whether a flush waits for the queued writes
+        self._error = None  # first error of the thread, raised by flush
+        self._closed = False
+        self._condition = threading.Condition()
+        self._io_lock = threading.Lock()  # one call to the storage at a time
+        self._scores = {}  # player name -> scores as last returned
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind", daemon=True
+        )
+        self._thread.start()
+
+    # Queue
+
+    def _queue(self, operation, key, *arguments) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Storage is closed.")
+            self._pending.append((operation, key, arguments))
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+            # Let the writes of the next moments join the batch
+            deadline = time.monotonic() + self.latency
+            with self._condition:
+                while (
+                    not self._closed
+                    and not self._hurry
+                    and self._condition.wait(max(0, deadline - time.monotonic()))
+                ):
+                    pass
+                batch, self._pending = self._pending, []
+                self._busy = True
+                self._hurry = False
+
+            try:
+                with self._io_lock:
+                    self._write(batch)
+            except Exception as error:
+                logging.exception("Saving user data in the background failed")
+                self._error = self._error or error
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, batch) -> None:
+        """Write a batch, merging the operations of a kind on one key."""
+        runs = {}  # (operation, key) -> arguments of each call, in call order
+        for operation, key, arguments in batch:
+            runs.setdefault((operation, key), []).append(arguments)
+
+        for (operation, key), run in sorted(
+            runs.items(), key=lambda item: OPERATIONS.index(item[0][0])
+        ):
+            if operation == "answer":
+                mastery_data = run[-1][0]
+                answers = [answer for _, *answer in run]
+                self.storage.record_answers(key, mastery_data, answers)
+            elif operation == "save_mastery":
+                self.storage.save_mastery(key, run[-1][0])
+            elif operation == "scores":
+                updates = [update for (update,) in run]
+                self.storage.update_player_scores(key, _chain(updates))
+            elif operation == "game":
+                for (game,) in run:
+                    self.storage.append_game(key, game)
+            elif operation == "players":
+                self.storage.save_players(run[-1][0])
+
+    def flush(self) -> None:
+        """Wait until every queued write is done, and raise its error if any."""
+        with self._condition:
+            while self._pending or self._busy:
+                self._hurry = True
+                self._condition.notify_all()
+                self._condition.wait()
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Write what is queued, stop the thread and close the storage."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            self.storage.close()
+
+    # Players
+
+    def load_players(self) -> Optional[List[str]]:
+        self.flush()
+        with self._io_lock:
+            return self.storage.load_players()
+
+    def save_players(self, players: List[str]) -> None:
+        self._queue("players", None, list(players))
+
+    # Mastery
+
+    def load_mastery(self, user_name: str) -> MasteryTable:
+        self.flush()
+        with self._io_lock:
+            return self.storage.load_mastery(user_name)
+
+    def record_answer(
+        self, user_name: str, mastery_data: MasteryTable, word_id, is_correct: bool
+    ) -> None:
+        self._queue("answer", user_name, mastery_data, word_id, is_correct)
+
+    def save_mastery(self, user_name: str, mastery_data: MasteryTable) -> None:
+        self._queue("save_mastery", user_name, mastery_data)
+
+    # Scores
+
+    def load_scores(self) -> dict:
+        self.flush()
+        with self._io_lock:
+            return self.storage.load_scores()
+
+    def load_player_scores(self, player_name: str) -> Optional[dict]:
+        self.flush()
+        with self._io_lock:
+            player_data = self.storage.load_player_scores(player_name)
+        self._scores[player_name] = player_data
+        return copy.deepcopy(player_data)
+
+    def save_player_scores(self, player_name: str, player_data: dict) -> None:
+        saved = self._scores[player_name] = copy.deepcopy(player_data)
+        self._queue("scores", player_name, lambda _: copy.deepcopy(saved))
+
+    def update_player_scores(self, player_name: str, update) -> dict:
+        """
+        Queue the update and return it applied to the scores last read.
+
+        The queued update is applied to the stored scores by the thread, so
+        games saved by other sessions meanwhile are kept.
+        """
+        if player_name not in self._scores:
+            self.load_player_scores(player_name)
+        player_data = update(copy.deepcopy(self._scores[player_name]))
+        self._scores[player_name] = player_data
+        self._queue("scores", player_name, update)
+        return copy.deepcopy(player_data)
+
+    # Game history
+
+    def append_game(self, player_name: str, game: GameRecord) -> None:
+        self._queue("game", player_name, game)
+
+    def load_games(self, player_name: str) -> List[GameRecord]:
+        self.flush()
+        with self._io_lock:
+            return self.storage.load_games(player_name)
+
+    def history_players(self) -> List[str]:
+        self.flush()
+        with self._io_lock:
+            return self.storage.history_players()
+
+
+def _chain(updates):
+    """Single score update applying the given ones in order."""
+
+    def update(player_data):
+        for single_update in updates:
+            player_data = single_update(player_data)
+        return player_data
+
+    return update
@@ -4,10 +4,12 @@
 
 # MVC imports
 from models.language_model import LanguageModel
+from models.vocabulary_catalog import VocabularyCatalog
 from models.vocabulary_model import VocabularyModel
 from models.player_model import PlayerModel
 from models.mastery_model import MasteryModel
 from models.score_model import ScoreModel
+from models.storage import open_storage
 
 from views.cli_view import CLIView
 
@@ -17,6 +19,7 @@ from controllers.player_controller import PlayerController
 from controllers.score_controller import ScoreController
 from controllers.game_controller import GameController
 
+from utilities.logging_util import setup_logging
 
 # Initialize colorama
 
@@ -32,12 +35,29 @@ def main():
     """
 
     config_controller = ConfigController()
+    # Logs go to utilities/logs from here on, nothing is set up on import
+    setup_logging(
+        asynchronous=config_controller.get_log_async(),
+        structured=config_controller.get_log_format() == "json",
+        debug_sample=config_controller.get_log_debug_sample(),
+    )
 
     lang_model = LanguageModel(config_controller.get_language_file())
-    vocabulary_model = VocabularyModel()
-    player_model = PlayerModel()
-    mastery_model = MasteryModel()
-    score_model = ScoreModel()
+    # The corpus is parsed once and shared by every model that needs it
+    catalog = VocabularyCatalog(
+        ingest_workers=config_controller.get_vocabulary_ingest_workers()
+    )
+    vocabulary_model = VocabularyModel(
+        catalog, storage=config_controller.get_vocabulary_storage()
+    )
+    storage = open_storage(
+        config_controller.get_storage_backend(),
+        config_controller.get_user_data_format(),
+        config_controller.get_write_latency(),
+    )
+    player_model = PlayerModel(storage)
+    mastery_model = MasteryModel(storage)
+    score_model = ScoreModel(storage)
 
     view = CLIView(lang_model)
     player_controller = PlayerController(player_model, mastery_model, view, lang_model)
@@ -52,7 +72,11 @@ def main():
         vocab_controller,
         score_controller,
     )
-    game.run()
+    try:
+        game.run()
+    finally:
+        # Writes whatever is still queued before leaving
+        storage.close()
 
 
 if __name__ == "__main__":
@@ -1,3 +0,0 @@
-from utilities.logging_util import logger
-
-logger.info("Logging is working! Logger module initalized.")
@@ -1,7 +1,88 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+
+# Attributes every LogRecord has; any other one was passed through `extra`
+RECORD_ATTRIBUTES = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
+}
+
+# Handlers installed by setup_logging, and the listener feeding them
+_handlers = []
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as JSON lines.
+
+    Each line is an object with the time, level, logger name and message,
+    the traceback when there is one, and the fields passed through `extra`.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """
+    Keep one debug record in every `every` from each call site.
+
+    Records above DEBUG always pass. Sampling is counted per line of code
+    logging, so a chatty debug line does not hide the rare ones.
+    The decision is kept on the record, so a sampler shared by several
+    handlers counts each record once.
+    """
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self._counts = {}
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG:
+            return True
+        if not hasattr(record, "_sampled"):
+            key = (record.pathname, record.lineno)
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+            record._sampled = count % self.every == 0
+        return record._sampled
+
+
+class _QueueHandler(QueueHandler):
+    """
+    QueueHandler keeping the record fields for the formatters run by the
+    listener: the message is merged with its arguments and the traceback
+    rendered, as the arguments and traceback may not outlive the call.
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 def setup_logging(
@@ -9,19 +90,32 @@ def setup_logging(
     log_file="latin_quiz.log",
     console_level=logging.CRITICAL,
     file_level=logging.DEBUG,
+    asynchronous=True,
+    structured=False,
+    debug_sample=1,
 ):
     """
     Set up comprehensive logging with more advanced features.
 
+    Calling it again replaces the handlers it installed instead of adding
+    more of them.
+
     Args:
         log_dir (str): Directory to store log files
         log_file (str): Name of the log file
         console_level (int): Logging level for console output
         file_level (int): Logging level for file output
+        asynchronous (bool): Hand the records to a background thread through
+            a queue, so logging never waits for the console or the disk
+        structured (bool): Write the log file as JSON lines
+        debug_sample (int): Keep one debug record in every debug_sample from
+            each call site, 1 to keep them all
 
     Returns:
         logging.Logger: Configured logger instance
     """
+    shutdown_logging()
+
     # Ensure log directory exists
     log_path = Path(__file__).parent / log_dir
     log_path.mkdir(exist_ok=True)
@@ -49,17 +143,64 @@ def setup_logging(
         full_log_path,
         maxBytes=10 * 1024 * 1024,  # 10 MB
         backupCount=5,  # Keep 5 backup files
+        encoding="utf-8",
     )
     file_handler.setLevel(file_level)
-    file_handler.setFormatter(formatter)
+    if structured:
+        file_handler.setFormatter(JsonFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+    else:
+        file_handler.setFormatter(formatter)
+
+    global _listener
+    if asynchronous:
+        # The records are written by the listener thread
+        records = queue.SimpleQueue()
+        _listener = QueueListener(
+            records, console_handler, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        installed = [_QueueHandler(records)]
+        installed[0].setLevel(min(console_level, file_level))
+    else:
+        installed = [console_handler, file_handler]
+
+    # Dropped before reaching the queue or a handler
+    if debug_sample > 1:
+        sampler = DebugSampler(debug_sample)
+        for handler in installed:
+            handler.addFilter(sampler)
 
     # Add handlers to the logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    for handler in installed:
+        logger.addHandler(handler)
+    _handlers[:] = installed
+    if asynchronous:
+        _handlers.extend([console_handler, file_handler])
 
     return logger
 
 
+def shutdown_logging():
+    """
+    Write the queued records and remove the handlers of setup_logging.
+
+    Registered to run at exit, and safe to call when logging is not set up.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    logger = logging.getLogger()
+    for handler in _handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    _handlers.clear()
+
+
+atexit.register(shutdown_logging)
+
+
 # Convenience function to get a module-specific logger
 def get_logger(name=None):
     """
@@ -74,5 +215,5 @@ def get_logger(name=None):
     return logging.getLogger(name)
 
 
-# Initialize logging when the module is imported
-logger = setup_logging()
+# Root logger, configured by setup_logging when the quiz starts
+logger = get_logger()
@@ -0,0 +1,66 @@
+# Copy the players, mastery data, scores and game history kept in the JSON
+# files of user_data into the SQLite database used when storage_backend is
+# "sqlite".
+# Run once from the repository root:
+#   python utilities/migrate_to_sqlite.py [data_dir] [database]
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.json_storage import USER_DATA_DIR, JsonStorage
+from models.sqlite_storage import DATABASE_FILE, SqliteStorage
+
+MASTERY_SUFFIX = "_vocabulary_mastery.json"
+
+
+def migrate(source: JsonStorage, target: SqliteStorage) -> None:
+    players = source.load_players() or []
+    target.save_players(players)
+    print(f"{len(players)} players")
+
+    # Mastery files may exist for players missing from the player list
+    names = [
+        path.name[: -len(MASTERY_SUFFIX)]
+        for path in source.data_path.glob(f"*{MASTERY_SUFFIX}")
+    ]
+    for user_name in sorted(names):
+        mastery_data = source.load_mastery(user_name)
+        played = [
+            word_id
+            for word_id in mastery_data
+            if not mastery_data.is_unplayed(word_id)
+            or word_id in mastery_data.schedules
+        ]
+        target.write_mastery(user_name, mastery_data, played)
+        print(f"{user_name}: {len(played)} words played")
+
+    scores = source.load_scores()
+    for player_name, player_data in scores.items():
+        target.save_player_scores(player_name, player_data)
+    print(f"{len(scores)} score records")
+
+    for player_name in source.history_players():
+        games = source.load_games(player_name)
+        for game in games:
+            target.append_game(player_name, game)
+        print(f"{player_name}: {len(games)} games of history")
+
+
+def main():
+    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else USER_DATA_DIR
+    database = Path(sys.argv[2]) if len(sys.argv) > 2 else DATABASE_FILE
+
+    if database.exists():
+        sys.exit(f"{database} already exists, remove it first to migrate again.")
+
+    target = SqliteStorage(database)
+    try:
+        migrate(JsonStorage(data_dir), target)
+    finally:
+        target.close()
+    print(f"Migrated {data_dir} to {database}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Recompute the smoothed scores of every player from their game history, for
+# instance after changing the smoothing period.
+# Run from the repository root:
+#   python utilities/recompute_scores.py [period] [ema|sma]
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from controllers.config_controller import ConfigController
+from models.score_model import ScoreModel
+from models.storage import open_storage
+
+
+def main():
+    period = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    smoother = sys.argv[2] if len(sys.argv) > 2 else "ema"
+
+    config_controller = ConfigController()
+    storage = open_storage(
+        config_controller.get_storage_backend(),
+        config_controller.get_user_data_format(),
+    )
+    try:
+        start = time.perf_counter()
+        replayed = ScoreModel(storage).recompute_scores(
+            period=period, smoother=smoother
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        storage.close()
+    print(f"Replayed {replayed} games in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
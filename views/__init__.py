@@ -1,6 +1,14 @@
-from utilities.logging_util import logger
+# Views are imported on first use, so that importing the base view does not
+# load the CLI and its dependencies
 
-logger.info("view module initalized.")
-# Import views
-from .base_view import BaseView
-from .cli_view import CLIView
+
+def __getattr__(name):
+    if name == "BaseView":
+        from .base_view import BaseView
+
+        return BaseView
+    if name == "CLIView":
+        from .cli_view import CLIView
+
+        return CLIView
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from models.language_model import LanguageModel
+from models.vocab_entry import VocabEntry
 
 
 class BaseView(ABC):
@@ -31,7 +32,7 @@ class BaseView(ABC):
         pass
 
     @abstractmethod
-    def display_latin_word(self, word_data: dict):
+    def display_latin_word(self, word_data: VocabEntry):
         pass
 
     @abstractmethod
@@ -43,7 +44,7 @@ class BaseView(ABC):
         pass
 
     @abstractmethod
-    def ask_for_answer(self) -> int:
+    def ask_for_answer(self, num_options: int = 4) -> int:
         pass
 
     @abstractmethod
@@ -67,12 +68,12 @@ class BaseView(ABC):
 
     @abstractmethod
     def display_question(
-        question_num: int, word_data: dict, options: list[str], level: int
+        question_num: int, word_data: VocabEntry, options: list[str], level: int
     ):
         pass
 
     @abstractmethod
-    def display_player_stats(self, player_name, player_data, levels):
+    def display_player_stats(self, player_name, player_data, levels, vocabularies):
         pass
 
     @abstractmethod
@@ -1,6 +1,6 @@
 from colorama import init, Fore, Style
 from models.language_model import LanguageModel
-from tabulate import tabulate
+from models.vocab_entry import VocabEntry
 
 
 from views.base_view import BaseView
@@ -75,7 +75,7 @@ class CLIView(BaseView):
     def display_available_files(self, files, min_id, max_id):
         print(f"\n{self.language_model.get('vocabulary_management.available_lists')}")
         print(
-            f"-1: {self.language_model.get('vocabulary_management.custom_range').format(min_id=min_id, max_id=max_id)}"
+            f"-1: {self.language_model.format('vocabulary_management.custom_range', min_id=min_id, max_id=max_id)}"
         )
         print(f"0: {self.language_model.get('vocabulary_management.all_chapters')}")
         for i, file in enumerate(files):
@@ -92,17 +92,19 @@ class CLIView(BaseView):
 
     def get_custom_range(self, min_id, max_id):
         range_input = input(
-            self.language_model.get("vocabulary_management.enter_range").format(
-                min_id=min_id, max_id=max_id
+            self.language_model.format(
+                "vocabulary_management.enter_range", min_id=min_id, max_id=max_id
             )
         )
         try:
             start, end = map(int, range_input.split("-"))
             if start < min_id or end > max_id:
                 print(
-                    self.language_model.get(
-                        "vocabulary_management.invalid_range"
-                    ).format(min_id=min_id, max_id=max_id)
+                    self.language_model.format(
+                        "vocabulary_management.invalid_range",
+                        min_id=min_id,
+                        max_id=max_id,
+                    )
                 )
             elif start > end:
                 print(
@@ -130,13 +132,13 @@ class CLIView(BaseView):
         )
         print("-" * 50 + Style.RESET_ALL)
 
-    def display_latin_word(self, word_data):
+    def display_latin_word(self, word_data: VocabEntry):
         print(
-            f"{self.language_model.get('core.latin_word', 'Latin word')}: {Fore.MAGENTA}{word_data['word']} ({word_data['form']}){Style.RESET_ALL}"
+            f"{self.language_model.get('core.latin_word', 'Latin word')}: {Fore.MAGENTA}{word_data.word} ({word_data.form}){Style.RESET_ALL}"
         )
-        if "word_type" in word_data:
+        if word_data.word_type:
             print(
-                f"{self.language_model.get('core.word_type', 'Word type')}: {word_data['word_type']}{Style.RESET_ALL}"
+                f"{self.language_model.get('core.word_type', 'Word type')}: {word_data.word_type}{Style.RESET_ALL}"
             )
 
     def display_hint(self, hint):
@@ -153,15 +155,15 @@ class CLIView(BaseView):
             for i, opt in enumerate(options, 1):
                 print(f"{i}. {opt}")
 
-    def ask_for_answer(self):
+    def ask_for_answer(self, num_options: int = 4):
         while True:
             try:
                 answer = int(
                     input(
-                        f"\n{self.language_model.get('core.enter_answer', 'Enter your answer')} (1-4): "
+                        f"\n{self.language_model.get('core.enter_answer', 'Enter your answer')} (1-{num_options}): "
                     )
                 )
-                if 1 <= answer <= 4:
+                if 1 <= answer <= num_options:
                     return answer
             except ValueError:
                 pass
@@ -205,16 +207,16 @@ class CLIView(BaseView):
 
     @staticmethod
     def display_question(
-        question_num: int, word_data: dict, options: list[str], level: int
+        question_num: int, word_data: VocabEntry, options: list[str], level: int
     ) -> int:
         """Display a quiz question and get user's answer"""
         print(f"\n{Fore.YELLOW}Question {question_num}/10{Style.RESET_ALL}")
         print(
-            f"Latin word: {Fore.MAGENTA}{word_data['word']} ({word_data['form']}){Style.RESET_ALL}"
+            f"Latin word: {Fore.MAGENTA}{word_data.word} ({word_data.form}){Style.RESET_ALL}"
         )
 
         if level == 3:
-            print(f"Word type: {word_data.get('word_type', '')}")
+            print(f"Word type: {word_data.word_type}")
 
         # Display options
         for i, option in enumerate(options, 1):
@@ -230,7 +232,7 @@ class CLIView(BaseView):
             except ValueError:
                 print("Please enter a valid number between 1 and 4.")
 
-    def display_player_stats(self, player_name, player_data, levels):
+    def display_player_stats(self, player_name, player_data, levels, vocabularies=None):
         if not player_data:
             print(
                 f"{Fore.CYAN}{self.language_model.get('core.no_score_available', 'No score available')}{Style.RESET_ALL}"
@@ -246,7 +248,8 @@ class CLIView(BaseView):
             )
         print()
 
-        vocabularies = sorted(player_data["vocabularies"].keys())
+        if vocabularies is None:
+            vocabularies = sorted(player_data["vocabularies"].keys())
         headers = (
             [self.language_model.get("core.level")]
             + vocabularies
@@ -263,10 +266,9 @@ class CLIView(BaseView):
 
             for vocab_id in vocabularies:
                 vocab_data = player_data["vocabularies"][vocab_id]
-                if str(level) not in vocab_data["levels"]:
-                    vocab_data["levels"][str(level)] = {"ema": 0.0, "games_played": 0}
-
-                level_data = vocab_data["levels"][str(level)]
+                level_data = vocab_data["levels"].get(
+                    str(level), {"ema": 0.0, "games_played": 0}
+                )
                 ema = level_data["ema"]
                 played = level_data["games_played"]
 
@@ -306,6 +308,10 @@ class CLIView(BaseView):
             avg_row.append(avg_color)
 
         table_data.append(avg_row)
+
+        # Imported on first use, it is only needed once the stats are shown
+        from tabulate import tabulate
+
         print(tabulate(table_data, headers=headers, tablefmt="grid", stralign="center"))
 
     @staticmethod
@@ -347,7 +353,7 @@ class CLIView(BaseView):
 
     def display_updated_statistics_message(self, player_name):
         print(
-            f"\n{Fore.CYAN}{self.language_model.get('core.updated_statistics').format(player=player_name)}:{Style.RESET_ALL}"
+            f"\n{Fore.CYAN}{self.language_model.format('core.updated_statistics', player=player_name)}:{Style.RESET_ALL}"
         )
 
     def display_thanks_for_playing(self):
@@ -381,7 +387,7 @@ class CLIView(BaseView):
         2. Level 2 (hint displayed after answering)
         3. Level 3 (options of the same word type, hint after answering)
         4. Level 4 (options of the same word type, word prioritized by user mastery)
-        5. Level 5 (options of the same word type, word and options by user mastery) - not implemented
+        5. Level 5 (options of the same word type, words due for review first)
 
         Returns:
             int: The selected level (1, 2, 3, 4 or 5).
@@ -393,14 +399,15 @@ class CLIView(BaseView):
 
         if self.language_model.language != "dutch":
             print(f"0. {self.language_model.get('level_management.level_0_name')}")
-            levels = [0, 1, 2, 3, 4]
+            levels = [0, 1, 2, 3, 4, 5]
         else:
-            levels = [1, 2, 3, 4]
+            levels = [1, 2, 3, 4, 5]
 
         print(f"1. {self.language_model.get('level_management.level_1_name')}")
         print(f"2. {self.language_model.get('level_management.level_2_name')}")
         print(f"3. {self.language_model.get('level_management.level_3_name')}")
         print(f"4. {self.language_model.get('level_management.level_4_name')}")
+        print(f"5. {self.language_model.get('level_management.level_5_name')}")
 
         while True:
             try:
@@ -411,9 +418,9 @@ class CLIView(BaseView):
                 )
                 if level in levels:
                     print(
-                        self.language_model.get(
-                            "level_management.selected_level"
-                        ).format(level=level)
+                        self.language_model.format(
+                            "level_management.selected_level", level=level
+                        )
                     )
                     return level
                 print(self.language_model.get("level_management.invalid_level_number"))
@@ -0,0 +1,132 @@
+# Run many quiz processes against the same user data and check that no
+# answer, game or player is lost. Exits non-zero on a lost update.
+# Run from the repository root:
+#   python zone_playground/concurrency_stress.py [json|sqlite] [workers] [games]
+#       [write latency]
+
+import multiprocessing
+import random
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.json_storage import JsonStorage
+from models.mastery_model import MasteryModel
+from models.player_model import PlayerModel
+from models.score_model import ScoreModel
+from models.sqlite_storage import SqliteStorage
+from models.write_behind import WriteBehindStorage
+
+PLAYER = "Stress"
+WORDS = 40  # few words, so that the workers answer the same ones
+ANSWERS_PER_GAME = 10
+VOCABULARIES = ["chapter1.txt", "chapter2.txt", "chapter3.txt"]
+
+
+def open_test_storage(backend, data_dir, latency=0):
+    if backend == "sqlite":
+        storage = SqliteStorage(data_dir / "quyzz.sqlite3")
+    else:
+        # A tiny journal limit makes the workers compact each other's answers
+        storage = JsonStorage(data_dir, journal_limit=512)
+    if latency > 0:
+        storage = WriteBehindStorage(storage, latency)
+    return storage
+
+
+def worker(backend, data_dir, index, games, latency):
+    """Play games as PLAYER and return the answers given."""
+    rng = random.Random(index)
+    storage = open_test_storage(backend, data_dir, latency)
+    try:
+        PlayerModel(storage).add_player(f"worker{index}")
+        mastery_model = MasteryModel(storage)
+        score_model = ScoreModel(storage)
+
+        correct, total = Counter(), Counter()
+        for _ in range(games):
+            mastery_data = mastery_model.load_mastery_data(PLAYER)
+            for _ in range(ANSWERS_PER_GAME):
+                word_id = rng.randint(1, WORDS)
+                is_correct = rng.random() < 0.7
+                mastery_data.record(word_id, is_correct)
+                mastery_model.record_answer(PLAYER, mastery_data, word_id, is_correct)
+                correct[word_id] += is_correct
+                total[word_id] += 1
+            mastery_model.save_mastery_data(PLAYER, mastery_data)
+            score_model.update_score(
+                PLAYER, [rng.choice(VOCABULARIES)], rng.randint(1, 5), 50.0
+            )
+        return correct, total
+    finally:
+        storage.close()
+
+
+def check(backend, data_dir, workers, games, correct, total) -> list:
+    """Describe every update missing from the shared storage."""
+    storage = open_test_storage(backend, data_dir)
+    try:
+        errors = []
+        players = storage.load_players() or []
+        missing = [f"worker{i}" for i in range(workers) if f"worker{i}" not in players]
+        if missing:
+            errors.append(f"players lost: {missing}")
+
+        mastery_data = storage.load_mastery(PLAYER)
+        for word_id in range(1, WORDS + 1):
+            expected = (correct[word_id], total[word_id])
+            if mastery_data.attempts(word_id) != expected:
+                errors.append(
+                    f"word {word_id}: {mastery_data.attempts(word_id)} != {expected}"
+                )
+
+        player_data = storage.load_player_scores(PLAYER)
+        played = sum(
+            level_data["games_played"]
+            for vocab_data in player_data["vocabularies"].values()
+            for level_data in vocab_data["levels"].values()
+        )
+        if played != workers * games:
+            errors.append(f"scores count {played} games of {workers * games}")
+
+        history = storage.load_games(PLAYER)
+        if len(history) != workers * games:
+            errors.append(f"history holds {len(history)} games of {workers * games}")
+        return errors
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    backend = sys.argv[1] if len(sys.argv) > 1 else "json"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    games = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    latency = float(sys.argv[4]) if len(sys.argv) > 4 else 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.starmap(
+                worker,
+                [
+                    (backend, data_dir, index, games, latency)
+                    for index in range(workers)
+                ],
+            )
+
+        correct, total = Counter(), Counter()
+        for worker_correct, worker_total in results:
+            correct.update(worker_correct)
+            total.update(worker_total)
+
+        errors = check(backend, data_dir, workers, games, correct, total)
+        answers = sum(total.values())
+        print(
+            f"{backend}: {workers} workers, {workers * games} games, {answers} answers"
+        )
+        if errors:
+            print("\n".join(errors))
+            sys.exit(1)
+        print("No update lost")
@@ -0,0 +1,93 @@
+# Compare sequential and parallel ingestion of a synthetic vocabulary corpus.
+# Run from the repository root:
+#   python zone_playground/ingest_benchmark.py [files] [lines] [workers]
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.vocabulary_cache import VocabularyCache
+from models.vocabulary_catalog import VocabularyCatalog
+from models.vocabulary_manifest import VocabularyManifest
+from zone_playground.vocabulary_corpus import corpus_parts
+
+
+def write_corpus(directory, files, lines_per_file):
+    """
+    Write files chapters made of the real corpus lines with fresh IDs. Each
+    chapter ends with an incomplete line repeating its first ID, which the
+    parser and the manifest must both ignore.
+    """
+    corpus = corpus_parts()
+
+    word_id = 0
+    for index in range(files):
+        with open(directory / f"chapter{index:04d}.txt", "w", encoding="utf-8") as f:
+            first_id = word_id + 1
+            for _ in range(lines_per_file):
+                parts = corpus[word_id % len(corpus)]
+                word_id += 1
+                f.write("|".join([str(word_id)] + parts) + "\n")
+            f.write(f"{first_id}|incomplete\n")
+
+
+def timed_load(directory, cache_dir, workers, executor="process"):
+    catalog = VocabularyCatalog(
+        directory,
+        cache=VocabularyCache(cache_dir / "vocabulary"),
+        manifest=VocabularyManifest(directory, cache_dir / "manifest.pickle"),
+        ingest_workers=workers,
+        ingest_executor=executor,
+    )
+    start = time.perf_counter()
+    vocabulary = catalog.load()
+    return time.perf_counter() - start, vocabulary
+
+
+def check_range_load(directory, cache_dir):
+    """Check that a range read through the manifest matches parsed files."""
+    catalog = VocabularyCatalog(
+        directory,
+        cache=VocabularyCache(cache_dir / "vocabulary"),
+        manifest=VocabularyManifest(directory, cache_dir / "manifest.pickle"),
+    )
+    min_id, max_id = catalog.id_range()
+    custom_range = (min_id, (min_id + max_id) // 2)
+    unparsed = catalog.load(custom_range=custom_range)
+    catalog.ingest()
+    parsed = catalog.load(custom_range=custom_range)
+    assert list(unparsed.items()) == list(parsed.items())
+    print(f"range load  {len(parsed)} words, identical before and after parsing")
+
+
+if __name__ == "__main__":
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else max(2, os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        corpus_dir = tmp / "vocabularies"
+        corpus_dir.mkdir()
+        write_corpus(corpus_dir, files, lines)
+        print(f"{files} files x {lines} lines, {workers} workers")
+
+        runs = [
+            ("sequential", 0, "process"),
+            ("threads", workers, "thread"),
+            ("processes", workers, "process"),
+        ]
+        reference = None
+        for name, run_workers, executor in runs:
+            cache_dir = tmp / f"cache-{name}"
+            cold, vocabulary = timed_load(corpus_dir, cache_dir, run_workers, executor)
+            warm, _ = timed_load(corpus_dir, cache_dir, run_workers, executor)
+            if reference is None:
+                reference = vocabulary
+            assert list(vocabulary.items()) == list(reference.items())
+            print(f"{name:<11} cold {cold:6.3f}s   cached {warm:6.3f}s")
+
+        check_range_load(corpus_dir, tmp / "cache-range")
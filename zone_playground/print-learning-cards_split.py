@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 import pandas as pd
 from reportlab.pdfgen import canvas
@@ -6,6 +7,9 @@ from reportlab.lib.units import cm
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.vocabulary_catalog import VocabularyCatalog
+
 
 def split_long_text(text, c, font_name, font_size, max_width=8.5 * cm):
     """
@@ -67,84 +71,79 @@ def create_square_pdf(vocab_list, fr_translations, filename, is_front=True):
     deja_vu_oblique_path = direc / "DejaVuSans-Oblique.ttf"
     pdfmetrics.registerFont(TTFont(f"{font_name}Italic", deja_vu_oblique_path))
 
-    for line in vocab_list:
-        # Split the line into parts
-        parts = line.split("|")
-
-        # Ensure we have enough parts
-        if len(parts) >= 5:
-            number = parts[0]
-            latin_word = parts[1]
-            latin_word_2 = parts[2]
-            translation_dutch = parts[3]
-            if len(parts[4]) > 0:
-                hint = parts[4]
-            else:
-                hint = " -- "
-            word_type = parts[5].strip() if len(parts) > 5 else ""
-
-            # Set font and clear the page
-            c.setFont(font_name, 36)
-
-            # Decide what to print based on front or back
-            if is_front:
-                # Center the number on the front
-                c.drawCentredString(4.5 * cm, (4.5 + 1.0) * cm, number)
-                count_char = len(latin_word)
-                if count_char > 10:
-                    c.setFont(font_name, 36 * 10 / count_char)
-                c.drawCentredString(4.5 * cm, (4.5 - 1.0) * cm, latin_word)
-            else:
-                # Calculate initial vertical position
-                start_y = 7 * cm  # Start higher to accommodate multiple lines
-                line_spacing = 24  # Space between lines
-
-                # Draw number
-                c.setFont(font_name, 16)
-                c.drawCentredString(4.5 * cm, start_y, number)
+    for word_id, entry in vocab_list.items():
+        number = str(word_id)
+        latin_word = entry.word
+        latin_word_2 = entry.form
+        translation_dutch = entry.translation
+        if len(entry.hint) > 0:
+            hint = entry.hint
+        else:
+            hint = " -- "
+        word_type = entry.word_type.strip()
+
+        # Set font and clear the page
+        c.setFont(font_name, 36)
+
+        # Decide what to print based on front or back
+        if is_front:
+            # Center the number on the front
+            c.drawCentredString(4.5 * cm, (4.5 + 1.0) * cm, number)
+            count_char = len(latin_word)
+            if count_char > 10:
+                c.setFont(font_name, 36 * 10 / count_char)
+            c.drawCentredString(4.5 * cm, (4.5 - 1.0) * cm, latin_word)
+        else:
+            # Calculate initial vertical position
+            start_y = 7 * cm  # Start higher to accommodate multiple lines
+            line_spacing = 24  # Space between lines
+
+            # Draw number
+            c.setFont(font_name, 16)
+            c.drawCentredString(4.5 * cm, start_y, number)
+            start_y -= line_spacing
+
+            # Draw latin_word_2
+            c.setFont(font_name, 16)
+            for line_text in split_long_text(latin_word_2, c, font_name, 16):
+                c.drawCentredString(4.5 * cm, start_y, line_text)
+                start_y -= line_spacing
+
+            # Draw translation_dutch
+            c.setFont(f"{font_name}Bold", 16)
+            if len(translation_dutch) > 25:
+                c.setFont(f"{font_name}Bold", 12)
+            for line_text in split_long_text(
+                translation_dutch,
+                c,
+                f"{font_name}Bold",
+                12 if len(translation_dutch) > 25 else 16,
+            ):
+                c.drawCentredString(4.5 * cm, start_y, line_text)
                 start_y -= line_spacing
 
-                # Draw latin_word_2
-                c.setFont(font_name, 16)
-                for line_text in split_long_text(latin_word_2, c, font_name, 16):
-                    c.drawCentredString(4.5 * cm, start_y, line_text)
-                    start_y -= line_spacing
-
-                # Draw translation_dutch
-                c.setFont(f"{font_name}Bold", 16)
-                if len(translation_dutch) > 25:
-                    c.setFont(f"{font_name}Bold", 12)
-                for line_text in split_long_text(
-                    translation_dutch,
-                    c,
-                    f"{font_name}Bold",
-                    12 if len(translation_dutch) > 25 else 16,
-                ):
-                    c.drawCentredString(4.5 * cm, start_y, line_text)
-                    start_y -= line_spacing
-
-                # Draw hint
-                c.setFont(font_name, 16)
-                hint_text = f"indice: {hint}"
-                if len(hint_text) > 25:
-                    c.setFont(font_name, 12)
-                for line_text in split_long_text(
-                    hint_text, c, font_name, 12 if len(hint_text) > 25 else 16
-                ):
-                    c.drawCentredString(4.5 * cm, start_y, line_text)
-                    start_y -= line_spacing
-
-                # Draw word type
-                c.setFont(font_name, 16)
-                c.drawCentredString(4.5 * cm, start_y, word_type)
+            # Draw hint
+            c.setFont(font_name, 16)
+            hint_text = f"indice: {hint}"
+            if len(hint_text) > 25:
+                c.setFont(font_name, 12)
+            for line_text in split_long_text(
+                hint_text, c, font_name, 12 if len(hint_text) > 25 else 16
+            ):
+                c.drawCentredString(4.5 * cm, start_y, line_text)
                 start_y -= line_spacing
 
-                # Draw French translation
-                c.setFont(f"{font_name}Italic", 10)
-                fr_text = f"traduction: {fr_translations[int(number)]}"
-                for line_text in split_long_text(fr_text, c, f"{font_name}Italic", 10):
-                    c.drawCentredString(4.5 * cm, start_y, line_text)
-                    start_y -= line_spacing
+            # Draw word type
+            c.setFont(font_name, 16)
+            c.drawCentredString(4.5 * cm, start_y, word_type)
+            start_y -= line_spacing
+
+            # Draw French translation
+            c.setFont(f"{font_name}Italic", 10)
+            fr_text = f"traduction: {fr_translations[int(number)]}"
+            for line_text in split_long_text(fr_text, c, f"{font_name}Italic", 10):
+                c.drawCentredString(4.5 * cm, start_y, line_text)
+                start_y -= line_spacing
 
         # Move to next page
         c.showPage()
@@ -157,10 +156,8 @@ current_dir = Path.cwd()
 print("Current Directory:", current_dir)
 
 
-with open(
-    current_dir / "vocabularies" / "hoofdstuck8.txt", "r", encoding="utf-8"
-) as file:
-    vocab_list = file.readlines()
+catalog = VocabularyCatalog(current_dir / "vocabularies")
+vocab_list = catalog.words("hoofdstuck8.txt")
 
 french_translation_filename = "french-translations.txt"
 df = pd.read_csv(
@@ -168,10 +165,6 @@ df = pd.read_csv(
 )
 translation_dict = df.set_index(0).to_dict()[1]
 
-
-# Remove any lines that are empty or don't contain the expected number of parts
-vocab_list = [line.strip() for line in vocab_list if "|" in line]
-
 # Generate PDFs
 create_square_pdf(
     vocab_list, translation_dict, "H8_vocabulary_front_9cm.pdf", is_front=True
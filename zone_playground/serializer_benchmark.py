@@ -0,0 +1,49 @@
+# Compare the user data formats on synthetic mastery snapshots.
+# Run from the repository root:
+#   python zone_playground/serializer_benchmark.py [sizes...]
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.mastery_table import MasteryTable
+from models.serializers import FORMATS, orjson, read_file, write_file
+
+
+def mastery_snapshot(words):
+    """Snapshot of a player having answered every one of words words."""
+    rng = random.Random(words)
+    mastery_data = MasteryTable()
+    for word_id in range(1, words + 1):
+        for _ in range(rng.randint(1, 6)):
+            mastery_data.record(word_id, rng.random() < 0.7)
+    return {"_meta": {"generation": 1}, **mastery_data.to_dict()}
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"orjson {'installed' if orjson() is not None else 'missing'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "mastery.json"
+        for words in sizes:
+            data = mastery_snapshot(words)
+            print(f"\n{words} words")
+            for data_format in FORMATS:
+                save, _ = timed(write_file, path, data, data_format, True)
+                load, loaded = timed(read_file, path)
+                assert loaded == data, data_format
+                size = path.stat().st_size / 1024 / 1024
+                print(
+                    f"{data_format:<8} save {save:6.3f}s   load {load:6.3f}s"
+                    f"   {size:7.2f} MB"
+                )
@@ -0,0 +1,104 @@
+# Measure the cold start of quizz.py: the time to import it, and the time
+# from launching it to its first prompt. Exits non-zero when the median of
+# either exceeds its budget, to catch slow imports creeping back in. The
+# quiz runs in a temporary directory, with an empty user_data.
+# Run from the repository root:
+#   python zone_playground/startup_benchmark.py [runs] [import budget ms]
+#       [first prompt budget ms]
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+IMPORT_BUDGET = 150  # ms
+FIRST_PROMPT_BUDGET = 200  # ms
+
+MEASURE_IMPORT = (
+    "import time; start = time.perf_counter(); import quizz; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time(workdir) -> float:
+    """Seconds taken by a fresh interpreter to import quizz."""
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT],
+        cwd=workdir,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def first_prompt_time(workdir, prompt: bytes) -> float:
+    """Seconds from launching quizz.py to the prompt appearing."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "quizz.py")],
+        cwd=workdir,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        output = b""
+        while prompt not in output:
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                raise RuntimeError("quizz.py exited before its first prompt")
+            output += chunk
+        return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+        process.stdin.close()
+        process.stdout.close()
+
+
+def first_prompt() -> bytes:
+    """Text of the player choice, the first prompt of the quiz."""
+    from controllers.config_controller import ConfigController
+    from models.language_model import LanguageModel
+
+    lang_model = LanguageModel(ConfigController().get_language_file())
+    return lang_model.get("player_management.enter_choice").encode("utf-8")
+
+
+def report(name, times, budget) -> bool:
+    median = statistics.median(times) * 1000
+    within = median <= budget
+    print(
+        f"{name:<13} median {median:6.1f} ms   best {min(times) * 1000:6.1f} ms"
+        f"   budget {budget} ms{'' if within else '   EXCEEDED'}"
+    )
+    return within
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    import_budget = float(sys.argv[2]) if len(sys.argv) > 2 else IMPORT_BUDGET
+    prompt_budget = float(sys.argv[3]) if len(sys.argv) > 3 else FIRST_PROMPT_BUDGET
+
+    prompt = first_prompt()
+    with tempfile.TemporaryDirectory() as workdir:
+        # The quiz runs on the real vocabularies but a fresh user_data
+        os.symlink(ROOT / "vocabularies", Path(workdir) / "vocabularies")
+        # One unmeasured run compiles the bytecode and fills the caches
+        first_prompt_time(workdir, prompt)
+
+        imports = [import_time(workdir) for _ in range(runs)]
+        prompts = [first_prompt_time(workdir, prompt) for _ in range(runs)]
+
+    print(f"{runs} runs")
+    within = report("import", imports, import_budget)
+    within = report("first prompt", prompts, prompt_budget) and within
+    sys.exit(0 if within else 1)
@@ -0,0 +1,24 @@
+# Lines of the real vocabulary corpus, shared by the scripts building
+# synthetic corpora from it. Found from this file, so the scripts can run
+# from any directory.
+
+import sys
+from pathlib import Path
+
+VOCABULARY_DIR = Path(__file__).resolve().parent.parent / "vocabularies"
+
+
+def corpus_parts():
+    """
+    Fields after the ID of every line of the real corpus, in file order.
+
+    Exits with an error when the corpus holds no line, as nothing could be
+    built from it.
+    """
+    corpus = []
+    for path in sorted(VOCABULARY_DIR.glob("*.txt")):
+        with open(path, "r", encoding="utf-8") as file:
+            corpus += [line.strip().split("|")[1:] for line in file if "|" in line]
+    if not corpus:
+        sys.exit(f"No vocabulary lines found in {VOCABULARY_DIR}")
+    return corpus
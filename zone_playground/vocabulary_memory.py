@@ -0,0 +1,62 @@
+# Measure the memory cost per vocabulary word, dict entries vs VocabEntry.
+# Run from the repository root: python zone_playground/vocabulary_memory.py [words]
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from models.vocab_entry import VocabEntry
+from zone_playground.vocabulary_corpus import corpus_parts
+
+
+def synthetic_lines(target_words):
+    """Repeat the real corpus with fresh IDs until it holds target_words lines."""
+    corpus = corpus_parts()
+
+    lines = []
+    while len(lines) < target_words:
+        for parts in corpus:
+            lines.append("|".join([str(len(lines) + 1)] + parts))
+            if len(lines) == target_words:
+                break
+    return lines
+
+
+def dict_entry(parts):
+    """Entry layout used before VocabEntry."""
+    return {
+        "word": parts[1],
+        "form": parts[2],
+        "translation": parts[3],
+        "hint": parts[4] if len(parts) > 4 else "",
+        "word_type": parts[5] if len(parts) > 5 else "",
+    }
+
+
+def vocab_entry(parts):
+    return VocabEntry.from_parts(parts[1:])
+
+
+def bytes_per_word(lines, make_entry):
+    gc.collect()
+    tracemalloc.start()
+    vocabulary = {}
+    for line in lines:
+        parts = line.split("|")
+        vocabulary[int(parts[0])] = make_entry(parts)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / len(vocabulary)
+
+
+if __name__ == "__main__":
+    words = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    lines = synthetic_lines(words)
+
+    before = bytes_per_word(lines, dict_entry)
+    after = bytes_per_word(lines, vocab_entry)
+    print(f"{words} words")
+    print(f"dict entries : {before:7.1f} bytes/word")
+    print(f"VocabEntry   : {after:7.1f} bytes/word ({after / before:.0%})")